@@ -10,346 +10,816 @@ soft-delete (is_deleted), base_layer_names, spatial_references, and app_settings
 
 import sqlite3
 import os
-import re
+import string
 import json
-import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+
+
+# Connection tuning applied on every connect(). WAL lets UI reads proceed
+# while a write is in flight; synchronous=NORMAL is durable under WAL and
+# drops the per-commit fsync of the rollback journal.
+# Run as one executescript() call.
+_CONNECTION_PRAGMAS = """
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -20000;        -- ~20 MB page cache
+    PRAGMA mmap_size = 268435456;      -- 256 MB memory-mapped I/O
+    PRAGMA wal_autocheckpoint = 1000;
+    PRAGMA foreign_keys = ON;
+"""
+
+# Columns added after the first release: (table, column, definition).
+_SCHEMA_MIGRATIONS = (
+    ("projects",      "is_deleted",           "INTEGER DEFAULT 0"),
+    ("projects",      "base_layer_names",     "TEXT DEFAULT ''"),
+    ("projects",      "db_type",              "TEXT DEFAULT 'spatialite'"),
+    ("projects",      "qgs_project_file",     "TEXT DEFAULT ''"),
+    ("projects",      "db_connection_string", "TEXT DEFAULT ''"),
+    ("projects",      "workspace_paths",      "TEXT DEFAULT ''"),
+    ("assessments",   "is_deleted",           "INTEGER DEFAULT 0"),
+    ("task_details",  "engine_type",          "TEXT DEFAULT 'spatialite'"),
+    ("task_details",  "is_scenario",          "INTEGER DEFAULT 0"),
+    ("app_settings",  "schema_version",       "INTEGER DEFAULT 0"),
+)
+
+# Indexes for the columns every getter filters or joins on: (name, target).
+_INDEXES = (
+    ("idx_al_assess",   "assessment_layers(assessment_id, layer_type)"),
+    ("idx_task_prov",   "task_details(provenance_id, step_order)"),
+    ("idx_task_parent", "task_details(parent_task_id)"),
+    ("idx_prov_assess", "provenance(assessment_id, created_at)"),
+    ("idx_assess_proj", "assessments(project_id) WHERE is_deleted = 0"),
+    ("idx_ws_assess",   "workflow_steps(assessment_id, step_order)"),
+    ("idx_sr_aid",      "spatial_references(assessment_id, created_at)"),
+    # Covering: get_visible_layers / get_layer_visibility never touch the table
+    ("idx_lvs_aid_vis", "layer_visibility_state(assessment_id, visible, layer_name)"),
+)
+
+# Tables created by _create_tables().
+_TABLES = (
+    "projects", "assessments", "assessment_layers", "layer_visibility_state",
+    "workflow_steps", "provenance", "task_details", "spatial_references",
+    "app_settings",
+)
+
+
+def _parse_json_list(raw):
+    """Decode a JSON array of names; NULL, '' or invalid JSON -> []."""
+    if not raw:
+        return []
+    try:
+        return json.loads(raw)
+    except (ValueError, TypeError):
+        return []
+
+
+class _SanitizeTable(dict):
+    """str.translate table: every char outside [A-Za-z0-9_] becomes '_'.
+
+    Entries are filled in on first lookup, so non-ASCII characters are
+    covered as well (same result as re.sub(r'[^a-zA-Z0-9_]', '_', ...)).
+    """
+
+    _KEEP = frozenset(map(ord, string.ascii_letters + string.digits + '_'))
+
+    def __missing__(self, codepoint):
+        value = codepoint if codepoint in self._KEEP else '_'
+        self[codepoint] = value
+        return value
+
+
+# Translation table for project DB file names (one '_' per character).
+_SANITIZE_TABLE = _SanitizeTable()
+
+# Project row as returned by the getters: the one place to list its columns.
+# Created after _migrate_schema() since it reads migrated columns.
+_VIEWS = (
+    ("v_projects", """
+       SELECT id, uuid, name, description, db_path, created_at,
+              COALESCE(is_deleted, 0) AS is_deleted,
+              COALESCE(base_layer_names, '') AS base_layer_names,
+              COALESCE(db_type, 'spatialite') AS db_type,
+              COALESCE(qgs_project_file, '') AS qgs_project_file
+       FROM projects"""),
+)
+
+# Worker threads for background project DB (SpatiaLite) initialization.
+_DB_INIT_WORKERS = 2
+
+# WAL size above which maybe_checkpoint() folds it back into the database.
+_WAL_CHECKPOINT_BYTES = 4 * 1024 * 1024
+
+# Size of sqlite3's per-connection prepared-statement cache (default 128).
+_STATEMENT_CACHE_SIZE = 256
+
+# Read queries are module-level constants so every call passes the very same
+# SQL string and hits sqlite3's prepared-statement cache.
+_SQL_ALL_PROJECTS = "SELECT * FROM v_projects WHERE is_deleted = 0 ORDER BY name"
+_SQL_PROJECT_BY_ID = "SELECT * FROM v_projects WHERE id = ?"
+_SQL_PROJECT_BY_NAME = "SELECT * FROM v_projects WHERE name = ?"
+
+_SQL_INSERT_PROJECT = (
+    "INSERT INTO projects (uuid, name, description, db_path) VALUES (?, ?, ?, ?)"
+)
+_SQL_ALL_PROJECT_IDS = "SELECT name, id FROM projects"
+_SQL_PROJECT_IDS_BY_NAMES = (
+    "SELECT name, id FROM projects WHERE name IN (SELECT value FROM json_each(?))"
+)
+
+_SQL_ALL_ASSESSMENT_KEYS = "SELECT project_id, name FROM assessments"
+_SQL_INSERT_ASSESSMENT = """
+    INSERT INTO assessments
+    (uuid, project_id, name, description, target_layer, spatial_extent)
+    VALUES (?, ?, ?, ?, ?, ?)"""
+_SQL_ASSESSMENT_IDS_BY_UUIDS = (
+    "SELECT uuid, id FROM assessments WHERE uuid IN (SELECT value FROM json_each(?))"
+)
+
+# INSERT ... RETURNING (SQLite 3.35+). executemany() discards RETURNING rows,
+# so the bulk inserts take all rows as one JSON array of row arrays and get
+# the new ids back from the same statement.
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+_SQL_BULK_INSERT_PROJECTS = """
+    INSERT INTO projects (uuid, name, description, db_path)
+    SELECT json_extract(value, '$[0]'), json_extract(value, '$[1]'),
+           json_extract(value, '$[2]'), json_extract(value, '$[3]')
+    FROM json_each(?)
+    RETURNING name, id"""
+_SQL_BULK_INSERT_ASSESSMENTS = """
+    INSERT INTO assessments
+    (uuid, project_id, name, description, target_layer, spatial_extent)
+    SELECT json_extract(value, '$[0]'), json_extract(value, '$[1]'),
+           json_extract(value, '$[2]'), json_extract(value, '$[3]'),
+           json_extract(value, '$[4]'), json_extract(value, '$[5]')
+    FROM json_each(?)
+    RETURNING uuid, id"""
+_SQL_INSERT_ASSESSMENT_LAYER = """
+    INSERT INTO assessment_layers
+    (assessment_id, layer_name, layer_type, geometry_type)
+    VALUES (?, ?, ?, ?)"""
+
+# Output layer names come back joined by CHAR(31) (unit separator), in
+# insertion order.
+_SQL_ASSESSMENTS_FOR_PROJECT = """
+    SELECT a.id, a.uuid, a.project_id, a.name, a.description,
+           a.target_layer, a.spatial_extent, a.created_at,
+           (SELECT GROUP_CONCAT(layer_name, CHAR(31)) FROM (
+                SELECT layer_name FROM assessment_layers
+                WHERE assessment_id = a.id AND layer_type = 'output'
+                ORDER BY id)) AS output_tables
+    FROM assessments a
+    WHERE a.project_id = ? AND a.is_deleted = 0
+    ORDER BY a.name"""
+_SQL_ASSESSMENT_BY_ID = """
+    SELECT id, uuid, project_id, name, description,
+           target_layer, spatial_extent, created_at
+    FROM assessments
+    WHERE id = ? AND is_deleted = 0"""
+# Soft-deleted rows are deliberately included: UNIQUE(project_id, name)
+# still holds for them, so their names cannot be reused.
+_SQL_ASSESSMENT_NAMES = "SELECT name FROM assessments WHERE project_id = ?"
+
+_SQL_ASSESSMENT_LAYERS = """
+    SELECT id, assessment_id, layer_name, layer_type, geometry_type
+    FROM assessment_layers WHERE assessment_id = ?"""
+_SQL_ASSESSMENT_LAYERS_BY_TYPE = """
+    SELECT id, assessment_id, layer_name, layer_type, geometry_type
+    FROM assessment_layers WHERE assessment_id = ? AND layer_type = ?"""
+# Assessment + its project's db_path + its input layers, one row per layer
+# (a single row with NULL layer columns when it has none)
+_SQL_RERUN_CONTEXT = """
+    SELECT a.id, a.uuid, a.project_id, a.name, a.description,
+           a.target_layer, a.spatial_extent, a.created_at,
+           p.db_path,
+           al.id AS layer_id, al.layer_name, al.layer_type, al.geometry_type
+    FROM assessments a
+    JOIN projects p ON p.id = a.project_id
+    LEFT JOIN assessment_layers al
+           ON al.assessment_id = a.id AND al.layer_type = 'input'
+    WHERE a.id = ? AND a.is_deleted = 0
+    ORDER BY al.id"""
+
+_SQL_UPSERT_VISIBILITY = """
+    INSERT INTO layer_visibility_state (assessment_id, layer_name, visible)
+    VALUES (?, ?, ?)
+    ON CONFLICT (assessment_id, layer_name) DO UPDATE SET visible = excluded.visible"""
+_SQL_LAYER_VISIBILITY = (
+    "SELECT layer_name, visible FROM layer_visibility_state WHERE assessment_id = ?"
+)
+_SQL_VISIBLE_LAYERS = (
+    "SELECT layer_name FROM layer_visibility_state "
+    "WHERE assessment_id = ? AND visible = 1"
+)
+
+_SQL_WORKFLOW_STEPS = """
+    SELECT id, assessment_id, step_order, operation, parameters, created_at
+    FROM workflow_steps WHERE assessment_id = ? ORDER BY step_order"""
+
+_SQL_PROVENANCE_FOR_ASSESSMENT = """
+    SELECT id, uuid, assessment_id, name, description, created_at
+    FROM provenance WHERE assessment_id = ? ORDER BY created_at"""
+
+_TASK_COLUMNS = """id, uuid, provenance_id, parent_task_id, step_order, operation,
+                   category, input_tables, output_tables, db_type, added_to_map,
+                   scenario, duration_ms, parameters, comments, created_at,
+                   COALESCE(engine_type, 'spatialite') AS engine_type,
+                   COALESCE(is_scenario, 0) AS is_scenario"""
+_SQL_TASKS_FOR_PROVENANCE = (
+    f"SELECT {_TASK_COLUMNS} FROM task_details "
+    f"WHERE provenance_id = ? ORDER BY step_order"
+)
+_SQL_CHILD_TASKS = (
+    f"SELECT {_TASK_COLUMNS} FROM task_details "
+    f"WHERE parent_task_id = ? ORDER BY step_order"
+)
+
+# app_settings columns readable/writable through get/set_app_setting, with
+# their (SELECT, UPDATE) statements built once.
+_APP_SETTING_KEYS = frozenset({
+    'plugin_version', 'default_project_dir', 'default_base_layers_group',
+    'output_group_name', 'symbology_defaults', 'misc',
+})
+_APP_SETTING_SQL = {
+    key: (f"SELECT {key} FROM app_settings WHERE id = 1",
+          f"UPDATE app_settings SET {key} = ? WHERE id = 1")
+    for key in _APP_SETTING_KEYS
+}
+
+# Every task of a provenance in sibling order (step_order, then id);
+# build_task_tree nests them under their parents.
+_SQL_TASK_TREE = (
+    f"SELECT {_TASK_COLUMNS} FROM task_details "
+    f"WHERE provenance_id = ? ORDER BY step_order, id"
+)
+
+_SQL_SPATIAL_REFERENCES = """
+    SELECT id, uuid, assessment_id, name, overlay_layer_name,
+           source_tables, source_db_type, source_db_path, srid, created_at
+    FROM spatial_references WHERE assessment_id = ? ORDER BY created_at"""
+
+
+def _format_uuid4(b):
+    """Format 16 random bytes as an RFC 4122 version-4 UUID string."""
+    b = bytearray(b)
+    b[6] = (b[6] & 0x0F) | 0x40  # version 4
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def _new_id():
+    """Return a random version-4 UUID string (cheaper than uuid4())."""
+    return _format_uuid4(os.urandom(16))
+
+
+def _new_ids(n):
+    """Yield n version-4 UUID strings from a single os.urandom() read."""
+    buf = os.urandom(16 * n)
+    for i in range(0, 16 * n, 16):
+        yield _format_uuid4(buf[i:i + 16])
+
+
+def _dumps_list(values):
+    """Serialize a list of names as compact JSON; None or empty -> ''."""
+    if not values:
+        return ''
+    return json.dumps(values, separators=(',', ':'), ensure_ascii=False)
+
+
+def _synchronized(method):
+    """Run an AdminManager method while holding the instance's connection lock."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
 
 
 class AdminManager:
     """Manages project and assessment metadata in admin.sqlite."""
 
+    # Bump when _SCHEMA_MIGRATIONS gains entries.
+    SCHEMA_VERSION = 2
+
     def __init__(self, plugin_dir):
         self.plugin_dir = plugin_dir
         self.db_path = os.path.join(plugin_dir, "admin.sqlite")
         self.projects_dir = os.path.join(plugin_dir, "projects")
         self.connection = None
+        self._cursor = None
+        self.journal_mode = None
+        self._tx_depth = 0
+        # One connection shared across threads; the lock serializes its use.
+        self._lock = threading.RLock()
+        # project id -> project dict, filled by get_project(); writes to a
+        # project row drop its entry
+        self._project_cache = {}
+        # project id -> set of assessment names (soft-deleted included),
+        # filled by the name lookups; kept in step by create/purge
+        self._name_cache = {}
+        # abs project DB path -> Future of its SpatiaLite init
+        self._pending_db_init = {}
+        self._db_init_pool = None
 
     # ------------------------------------------------------------------ #
     #  Connection
     # ------------------------------------------------------------------ #
 
+    @_synchronized
     def connect(self):
         """Open SQLite connection, ensure schema and projects directory exist."""
-        self.connection = sqlite3.connect(self.db_path)
-        self.connection.execute("PRAGMA foreign_keys = ON")
-        self._create_tables()
-        self._migrate_schema()
+        # isolation_level=None: autocommit by default, explicit BEGIN/COMMIT
+        # in transaction().
+        self.connection = sqlite3.connect(
+            self.db_path,
+            isolation_level=None,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+            check_same_thread=False,
+        )
+        self.connection.row_factory = sqlite3.Row
+        # Long-lived cursor for the hot single-row reads/writes
+        self._cursor = self.connection.cursor()
+        self.journal_mode = self.connection.execute(
+            "PRAGMA journal_mode = WAL"
+        ).fetchone()[0]
+        self.connection.executescript(_CONNECTION_PRAGMAS)
+        if not self._schema_is_current():
+            self._create_tables()
+            self._migrate_schema()
+            self._create_indexes()
+            self._create_views()
         os.makedirs(self.projects_dir, exist_ok=True)
 
+    @_synchronized
     def disconnect(self):
-        """Close the SQLite connection."""
+        """Close the SQLite connection, refreshing planner stats and
+        truncating the WAL file first."""
         if self.connection:
+            try:
+                self.connection.execute("PRAGMA optimize")
+                self.connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error:
+                pass  # another connection is mid-read; WAL is reset later
+            self._cursor = None
+            self._project_cache.clear()
+            self._name_cache.clear()
             self.connection.close()
             self.connection = None
+        if self._db_init_pool is not None:
+            # Let queued project DB inits finish before the plugin unloads
+            self._db_init_pool.shutdown(wait=True)
+            self._db_init_pool = None
+            self._pending_db_init.clear()
+
+    @_synchronized
+    def maybe_checkpoint(self):
+        """Checkpoint the WAL if it has grown past _WAL_CHECKPOINT_BYTES.
+
+        Cheap enough to call after bulk writes or from a timer during a
+        long QGIS session. PASSIVE never blocks readers or writers.
+        Returns True if a checkpoint was run.
+        """
+        if not self.connection:
+            return False
+        try:
+            wal_size = os.path.getsize(self.db_path + "-wal")
+        except OSError:
+            return False  # no WAL file (not in WAL mode, or already reset)
+        if wal_size <= _WAL_CHECKPOINT_BYTES:
+            return False
+        self.connection.execute("PRAGMA wal_checkpoint(PASSIVE)")
+        return True
+
+    @contextmanager
+    def transaction(self):
+        """Group several writes into a single commit.
+
+        Every write method runs inside transaction(), so a lone call still
+        commits on its own. Nested calls join the outermost block, which
+        commits on success and rolls back on error:
+
+            with admin_manager.transaction():
+                admin_manager.add_assessment_layer(aid, 'a', 'output')
+                admin_manager.set_layer_visibility(aid, 'a', True)
+
+        The connection lock is held for the whole block.
+        """
+        with self._lock:
+            self._tx_depth += 1
+            try:
+                if self._tx_depth > 1:
+                    yield self.connection
+                    return
+                # IMMEDIATE takes the write lock up front, so a block that
+                # reads before writing cannot fail half-way on lock upgrade.
+                self.connection.execute("BEGIN IMMEDIATE")
+                try:
+                    yield self.connection
+                except BaseException:
+                    self.connection.execute("ROLLBACK")
+                    # Rows read inside the block may have been rolled back
+                    self._project_cache.clear()
+                    self._name_cache.clear()
+                    raise
+                self.connection.execute("COMMIT")
+            finally:
+                self._tx_depth -= 1
+
+    def _schema_is_current(self):
+        """Return True if every table, migrated column, index and view exists.
+
+        One read of sqlite_master, so a warm start skips the DDL below and
+        never opens a write transaction.
+        """
+        schema = dict(self.connection.execute("SELECT name, sql FROM sqlite_master"))
+        return (
+            all(table in schema for table in _TABLES)
+            and all(column in (schema.get(table) or '')
+                    for table, column, _ in _SCHEMA_MIGRATIONS)
+            and all(name in schema for name, _ in _INDEXES)
+            and all(name in schema for name, _ in _VIEWS)
+        )
 
     def _create_tables(self):
         """Create all admin tables if they do not exist (new-database schema)."""
-        cursor = self.connection.cursor()
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS projects (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                uuid TEXT UNIQUE NOT NULL,
-                name TEXT NOT NULL UNIQUE,
-                description TEXT DEFAULT '',
-                db_path TEXT NOT NULL,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                is_deleted INTEGER DEFAULT 0,
-                base_layer_names TEXT DEFAULT '',
-                db_type TEXT DEFAULT 'spatialite',
-                qgs_project_file TEXT DEFAULT '',
-                db_connection_string TEXT DEFAULT '',
-                workspace_paths TEXT DEFAULT ''
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS assessments (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                uuid TEXT UNIQUE NOT NULL,
-                project_id INTEGER NOT NULL,
-                name TEXT NOT NULL,
-                description TEXT DEFAULT '',
-                target_layer TEXT DEFAULT '',
-                spatial_extent TEXT DEFAULT '',
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                is_deleted INTEGER DEFAULT 0,
-                UNIQUE(project_id, name),
-                FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS assessment_layers (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                assessment_id INTEGER NOT NULL,
-                layer_name TEXT NOT NULL,
-                layer_type TEXT NOT NULL CHECK(layer_type IN ('input', 'output', 'reference')),
-                geometry_type TEXT DEFAULT '',
-                FOREIGN KEY (assessment_id) REFERENCES assessments(id) ON DELETE CASCADE
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS layer_visibility_state (
-                assessment_id INTEGER NOT NULL,
-                layer_name TEXT NOT NULL,
-                visible INTEGER DEFAULT 1,
-                PRIMARY KEY (assessment_id, layer_name),
-                FOREIGN KEY (assessment_id) REFERENCES assessments(id) ON DELETE CASCADE
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS workflow_steps (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                assessment_id INTEGER NOT NULL,
-                step_order INTEGER NOT NULL,
-                operation TEXT NOT NULL,
-                parameters TEXT DEFAULT '',
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (assessment_id) REFERENCES assessments(id) ON DELETE CASCADE
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS provenance (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                uuid TEXT UNIQUE NOT NULL,
-                assessment_id INTEGER NOT NULL,
-                name TEXT NOT NULL,
-                description TEXT DEFAULT '',
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (assessment_id) REFERENCES assessments(id) ON DELETE CASCADE
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS task_details (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                uuid TEXT UNIQUE NOT NULL,
-                provenance_id INTEGER NOT NULL,
-                parent_task_id INTEGER DEFAULT NULL,
-                step_order INTEGER NOT NULL,
-                operation TEXT NOT NULL,
-                category TEXT DEFAULT '',
-                input_tables TEXT DEFAULT '',
-                output_tables TEXT DEFAULT '',
-                db_type TEXT DEFAULT 'spatialite',
-                added_to_map INTEGER DEFAULT 1,
-                scenario TEXT DEFAULT '',
-                symbology TEXT DEFAULT '',
-                duration_ms INTEGER DEFAULT 0,
-                parameters TEXT DEFAULT '',
-                comments TEXT DEFAULT '',
-                engine_type TEXT DEFAULT 'spatialite',
-                is_scenario INTEGER DEFAULT 0,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (provenance_id) REFERENCES provenance(id) ON DELETE CASCADE,
-                FOREIGN KEY (parent_task_id) REFERENCES task_details(id) ON DELETE SET NULL
-            )
-        """)
-
-        # Spatial references — overlay layer info per assessment (EMDS 8 adaptation)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS spatial_references (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                uuid TEXT UNIQUE NOT NULL,
-                assessment_id INTEGER NOT NULL,
-                name TEXT NOT NULL,
-                overlay_layer_name TEXT DEFAULT '',
-                source_tables TEXT DEFAULT '',
-                source_db_type TEXT DEFAULT 'spatialite',
-                source_db_path TEXT DEFAULT '',
-                srid INTEGER DEFAULT 4326,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (assessment_id) REFERENCES assessments(id) ON DELETE CASCADE
-            )
-        """)
-
-        # App settings — single-row config table (EMDS 8 adaptation)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS app_settings (
-                id INTEGER PRIMARY KEY CHECK (id = 1),
-                plugin_version TEXT DEFAULT '',
-                default_project_dir TEXT DEFAULT '',
-                default_base_layers_group TEXT DEFAULT 'Base Layers',
-                output_group_name TEXT DEFAULT 'Output Layers',
-                symbology_defaults TEXT DEFAULT '',
-                misc TEXT DEFAULT ''
-            )
-        """)
-        cursor.execute("INSERT OR IGNORE INTO app_settings (id) VALUES (1)")
-
-        self.connection.commit()
-        cursor.close()
+        with self.transaction():
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS projects (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    uuid TEXT UNIQUE NOT NULL,
+                    name TEXT NOT NULL UNIQUE,
+                    description TEXT DEFAULT '',
+                    db_path TEXT NOT NULL,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                    is_deleted INTEGER DEFAULT 0,
+                    base_layer_names TEXT DEFAULT '',
+                    db_type TEXT DEFAULT 'spatialite',
+                    qgs_project_file TEXT DEFAULT '',
+                    db_connection_string TEXT DEFAULT '',
+                    workspace_paths TEXT DEFAULT ''
+                )
+            """)
+
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS assessments (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    uuid TEXT UNIQUE NOT NULL,
+                    project_id INTEGER NOT NULL,
+                    name TEXT NOT NULL,
+                    description TEXT DEFAULT '',
+                    target_layer TEXT DEFAULT '',
+                    spatial_extent TEXT DEFAULT '',
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                    is_deleted INTEGER DEFAULT 0,
+                    UNIQUE(project_id, name),
+                    FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE
+                )
+            """)
+
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS assessment_layers (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    assessment_id INTEGER NOT NULL,
+                    layer_name TEXT NOT NULL,
+                    layer_type TEXT NOT NULL CHECK(layer_type IN ('input', 'output', 'reference')),
+                    geometry_type TEXT DEFAULT '',
+                    FOREIGN KEY (assessment_id) REFERENCES assessments(id) ON DELETE CASCADE
+                )
+            """)
+
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS layer_visibility_state (
+                    assessment_id INTEGER NOT NULL,
+                    layer_name TEXT NOT NULL,
+                    visible INTEGER DEFAULT 1,
+                    PRIMARY KEY (assessment_id, layer_name),
+                    FOREIGN KEY (assessment_id) REFERENCES assessments(id) ON DELETE CASCADE
+                )
+            """)
+
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS workflow_steps (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    assessment_id INTEGER NOT NULL,
+                    step_order INTEGER NOT NULL,
+                    operation TEXT NOT NULL,
+                    parameters TEXT DEFAULT '',
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (assessment_id) REFERENCES assessments(id) ON DELETE CASCADE
+                )
+            """)
+
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS provenance (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    uuid TEXT UNIQUE NOT NULL,
+                    assessment_id INTEGER NOT NULL,
+                    name TEXT NOT NULL,
+                    description TEXT DEFAULT '',
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (assessment_id) REFERENCES assessments(id) ON DELETE CASCADE
+                )
+            """)
+
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS task_details (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    uuid TEXT UNIQUE NOT NULL,
+                    provenance_id INTEGER NOT NULL,
+                    parent_task_id INTEGER DEFAULT NULL,
+                    step_order INTEGER NOT NULL,
+                    operation TEXT NOT NULL,
+                    category TEXT DEFAULT '',
+                    input_tables TEXT DEFAULT '',
+                    output_tables TEXT DEFAULT '',
+                    db_type TEXT DEFAULT 'spatialite',
+                    added_to_map INTEGER DEFAULT 1,
+                    scenario TEXT DEFAULT '',
+                    symbology TEXT DEFAULT '',
+                    duration_ms INTEGER DEFAULT 0,
+                    parameters TEXT DEFAULT '',
+                    comments TEXT DEFAULT '',
+                    engine_type TEXT DEFAULT 'spatialite',
+                    is_scenario INTEGER DEFAULT 0,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (provenance_id) REFERENCES provenance(id) ON DELETE CASCADE,
+                    FOREIGN KEY (parent_task_id) REFERENCES task_details(id) ON DELETE SET NULL
+                )
+            """)
+
+            # Spatial references — overlay layer info per assessment (EMDS 8 adaptation)
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS spatial_references (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    uuid TEXT UNIQUE NOT NULL,
+                    assessment_id INTEGER NOT NULL,
+                    name TEXT NOT NULL,
+                    overlay_layer_name TEXT DEFAULT '',
+                    source_tables TEXT DEFAULT '',
+                    source_db_type TEXT DEFAULT 'spatialite',
+                    source_db_path TEXT DEFAULT '',
+                    srid INTEGER DEFAULT 4326,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (assessment_id) REFERENCES assessments(id) ON DELETE CASCADE
+                )
+            """)
+
+            # App settings — single-row config table (EMDS 8 adaptation)
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS app_settings (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    plugin_version TEXT DEFAULT '',
+                    default_project_dir TEXT DEFAULT '',
+                    default_base_layers_group TEXT DEFAULT 'Base Layers',
+                    output_group_name TEXT DEFAULT 'Output Layers',
+                    symbology_defaults TEXT DEFAULT '',
+                    misc TEXT DEFAULT '',
+                    schema_version INTEGER DEFAULT 0
+                )
+            """)
+            self.connection.execute("INSERT OR IGNORE INTO app_settings (id) VALUES (1)")
 
     def _migrate_schema(self):
         """Apply incremental schema migrations for existing databases (idempotent).
 
-        Each ALTER TABLE is wrapped in try/except so it is safe to call on
-        both new and previously-existing databases.
+        Once a database reaches SCHEMA_VERSION this is a single SELECT.
+        Otherwise the existing columns of each table are read from
+        pragma_table_info and only the missing ones are added.
         """
-        migrations = [
-            # (table, column, definition)
-            ("projects",      "is_deleted",           "INTEGER DEFAULT 0"),
-            ("projects",      "base_layer_names",     "TEXT DEFAULT ''"),
-            ("projects",      "db_type",              "TEXT DEFAULT 'spatialite'"),
-            ("projects",      "qgs_project_file",     "TEXT DEFAULT ''"),
-            ("projects",      "db_connection_string", "TEXT DEFAULT ''"),
-            ("projects",      "workspace_paths",      "TEXT DEFAULT ''"),
-            ("assessments",   "is_deleted",           "INTEGER DEFAULT 0"),
-            ("task_details",  "engine_type",          "TEXT DEFAULT 'spatialite'"),
-            ("task_details",  "is_scenario",          "INTEGER DEFAULT 0"),
-        ]
-        cursor = self.connection.cursor()
-        for table, column, definition in migrations:
-            try:
-                cursor.execute(
-                    f'ALTER TABLE {table} ADD COLUMN {column} {definition}'
+        if self._get_schema_version() >= self.SCHEMA_VERSION:
+            return
+
+        missing = {}
+        for table, column, definition in _SCHEMA_MIGRATIONS:
+            missing.setdefault(table, []).append((column, definition))
+
+        with self.transaction():
+            for table, columns in missing.items():
+                existing = {
+                    row[0] for row in self.connection.execute(
+                        "SELECT name FROM pragma_table_info(?)", (table,)
+                    )
+                }
+                for column, definition in columns:
+                    if column not in existing:
+                        self.connection.execute(
+                            f'ALTER TABLE {table} ADD COLUMN {column} {definition}'
+                        )
+            self.connection.execute(
+                "UPDATE app_settings SET schema_version = ? WHERE id = 1",
+                (self.SCHEMA_VERSION,)
+            )
+
+    def _get_schema_version(self):
+        """Return the stored schema version (0 if the column is not there yet)."""
+        try:
+            row = self.connection.execute(
+                "SELECT schema_version FROM app_settings WHERE id = 1"
+            ).fetchone()
+        except sqlite3.OperationalError:
+            return 0  # pre-versioning database
+        return (row[0] or 0) if row else 0
+
+    def _create_indexes(self):
+        """Create indexes on the foreign-key / filter columns (idempotent).
+
+        Runs after _migrate_schema() because the partial index on
+        assessments needs the is_deleted column on older databases.
+        """
+        with self.transaction():
+            for name, target in _INDEXES:
+                self.connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS {name} ON {target}"
+                )
+            # Collect planner statistics once; later runs keep them.
+            has_stats = self.connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+            ).fetchone()
+            if not has_stats:
+                self.connection.execute("ANALYZE")
+
+    def _create_views(self):
+        """Create the read views (idempotent)."""
+        with self.transaction():
+            for name, select in _VIEWS:
+                self.connection.execute(
+                    f"CREATE VIEW IF NOT EXISTS {name} AS {select}"
                 )
-            except Exception:
-                pass  # column already exists — skip silently
-        self.connection.commit()
-        cursor.close()
 
     # ------------------------------------------------------------------ #
     #  Projects CRUD
     # ------------------------------------------------------------------ #
 
+    @_synchronized
     def create_project(self, name, description=""):
         """Insert a new project and initialize its SpatiaLite database.
         Returns the new project id.
+
+        The SpatiaLite database is initialized on a background thread;
+        get_project_db_path() waits for it before handing out the path.
         """
-        from .project_manager import ProjectManager
+        project_uuid = _new_id()
+        db_path = self._project_db_relpath(name)
 
-        project_uuid = str(uuid.uuid4())
-        sanitized = self._sanitize_name(name)
-        db_path = os.path.join("projects", f"{sanitized}.sqlite")
+        with self.transaction():
+            cursor = self.connection.execute(
+                _SQL_INSERT_PROJECT, (project_uuid, name, description, db_path)
+            )
+            project_id = cursor.lastrowid
 
-        cursor = self.connection.cursor()
-        cursor.execute(
-            "INSERT INTO projects (uuid, name, description, db_path) VALUES (?, ?, ?, ?)",
-            (project_uuid, name, description, db_path)
-        )
-        self.connection.commit()
-        project_id = cursor.lastrowid
-        cursor.close()
+        self._start_project_db_init(db_path)
+        return project_id
+
+    def _bulk_insert_projects(self, rows):
+        """Insert many projects with one executemany. Returns {name: new id}.
 
-        # Initialize the project's SpatiaLite database
+        Args:
+            rows: list of (uuid, name, description, db_path) tuples
+
+        Joins the caller's transaction if one is open. The caller starts
+        the SpatiaLite init for each db_path once it has committed.
+        """
+        if not rows:
+            return {}
+        with self.transaction():
+            if _HAS_RETURNING:
+                return dict(self.connection.execute(
+                    _SQL_BULK_INSERT_PROJECTS, (json.dumps(rows),)
+                ))
+            self.connection.executemany(_SQL_INSERT_PROJECT, rows)
+            names = json.dumps([r[1] for r in rows])
+            return dict(
+                self.connection.execute(_SQL_PROJECT_IDS_BY_NAMES, (names,))
+            )
+
+    def _project_db_relpath(self, name):
+        """Return the project DB path relative to plugin_dir."""
+        return os.path.join("projects", f"{self._sanitize_name(name)}.sqlite")
+
+    def _start_project_db_init(self, db_path):
+        """Initialize a project's SpatiaLite database off the caller's thread."""
         abs_db_path = os.path.join(self.plugin_dir, db_path)
+        if self._db_init_pool is None:
+            self._db_init_pool = ThreadPoolExecutor(
+                max_workers=_DB_INIT_WORKERS,
+                thread_name_prefix="project-db-init",
+            )
+        self._pending_db_init[abs_db_path] = self._db_init_pool.submit(
+            self._init_project_db, abs_db_path
+        )
+
+    @staticmethod
+    def _init_project_db(abs_db_path):
+        """Create the SpatiaLite file and its spatial metadata."""
+        from .project_manager import ProjectManager
         pm = ProjectManager(abs_db_path)
         pm.connect()
         pm.disconnect()
 
-        return project_id
+    def _wait_for_project_db(self, abs_db_path):
+        """Block until a pending background init of this DB has finished.
 
+        Re-raises the exception if the init failed, once, to the first
+        caller that waits on it.
+        """
+        future = self._pending_db_init.pop(abs_db_path, None)
+        if future is not None:
+            future.result()
+
+    @_synchronized
     def get_all_projects(self):
         """Return list of dicts with all non-deleted projects."""
-        cursor = self.connection.cursor()
-        cursor.execute(
-            """SELECT id, uuid, name, description, db_path, created_at,
-                      is_deleted, base_layer_names, db_type, qgs_project_file
-               FROM projects WHERE is_deleted = 0 ORDER BY name"""
-        )
-        rows = cursor.fetchall()
-        cursor.close()
+        rows = self.connection.execute(_SQL_ALL_PROJECTS).fetchall()
         return [self._row_to_project(r) for r in rows]
 
+    @_synchronized
     def get_project(self, project_id):
         """Return single project dict or None."""
-        cursor = self.connection.cursor()
-        cursor.execute(
-            """SELECT id, uuid, name, description, db_path, created_at,
-                      is_deleted, base_layer_names, db_type, qgs_project_file
-               FROM projects WHERE id = ?""",
-            (project_id,)
-        )
-        row = cursor.fetchone()
-        cursor.close()
-        return self._row_to_project(row) if row else None
-
+        project = self._project_cache.get(project_id)
+        if project is None:
+            row = self.connection.execute(_SQL_PROJECT_BY_ID, (project_id,)).fetchone()
+            if not row:
+                return None
+            project = self._project_cache[project_id] = self._row_to_project(row)
+        return dict(project)
+
+    @_synchronized
     def get_project_by_name(self, name):
         """Return single project dict or None."""
-        cursor = self.connection.cursor()
-        cursor.execute(
-            """SELECT id, uuid, name, description, db_path, created_at,
-                      is_deleted, base_layer_names, db_type, qgs_project_file
-               FROM projects WHERE name = ?""",
-            (name,)
-        )
-        row = cursor.fetchone()
-        cursor.close()
+        row = self._cursor.execute(_SQL_PROJECT_BY_NAME, (name,)).fetchone()
         return self._row_to_project(row) if row else None
 
     def _row_to_project(self, r):
-        """Convert a projects DB row tuple to a dict."""
-        return {
-            'id': r[0], 'uuid': r[1], 'name': r[2],
-            'description': r[3], 'db_path': r[4], 'created_at': r[5],
-            'is_deleted': bool(r[6]) if len(r) > 6 else False,
-            'base_layer_names': r[7] if len(r) > 7 else '',
-            'db_type': r[8] if len(r) > 8 else 'spatialite',
-            'qgs_project_file': r[9] if len(r) > 9 else '',
-        }
+        """Convert a projects sqlite3.Row to a dict."""
+        project = dict(r)
+        project['is_deleted'] = bool(project['is_deleted'])
+        return project
 
+    @_synchronized
     def delete_project(self, project_id):
         """Soft-delete a project and all its assessments (is_deleted = 1).
 
         The project's SpatiaLite file is kept on disk to preserve data.
         Use purge_project() to permanently remove the record and file.
         """
-        cursor = self.connection.cursor()
-        cursor.execute(
-            "UPDATE projects SET is_deleted = 1 WHERE id = ?", (project_id,)
-        )
-        cursor.execute(
-            "UPDATE assessments SET is_deleted = 1 WHERE project_id = ?", (project_id,)
-        )
-        self.connection.commit()
-        cursor.close()
+        self._project_cache.pop(project_id, None)
+        with self.transaction():
+            self.connection.execute(
+                "UPDATE projects SET is_deleted = 1 WHERE id = ?", (project_id,)
+            )
+            self.connection.execute(
+                "UPDATE assessments SET is_deleted = 1 WHERE project_id = ?", (project_id,)
+            )
 
+    @_synchronized
     def purge_project(self, project_id):
         """Permanently delete a project record and its SpatiaLite file from disk."""
-        project = self.get_project(project_id)
-        if not project:
-            # Check deleted projects too
-            cursor = self.connection.cursor()
-            cursor.execute(
-                "SELECT id, db_path FROM projects WHERE id = ?", (project_id,)
-            )
-            row = cursor.fetchone()
-            cursor.close()
-            if row:
-                project = {'id': row[0], 'db_path': row[1]}
-
-        cursor = self.connection.cursor()
-        cursor.execute("DELETE FROM projects WHERE id = ?", (project_id,))
-        self.connection.commit()
-        cursor.close()
+        with self.transaction():
+            project = self.get_project(project_id)
+            if not project:
+                # Check deleted projects too
+                row = self.connection.execute(
+                    "SELECT id, db_path FROM projects WHERE id = ?", (project_id,)
+                ).fetchone()
+                if row:
+                    project = {'id': row[0], 'db_path': row[1]}
+
+            self.connection.execute("DELETE FROM projects WHERE id = ?", (project_id,))
+            self._project_cache.pop(project_id, None)
+            self._name_cache.pop(project_id, None)
 
         if project and project.get('db_path'):
             abs_path = os.path.join(self.plugin_dir, project['db_path'])
+            try:
+                self._wait_for_project_db(abs_path)
+            except Exception as e:
+                print(f"Warning: Project DB {abs_path} failed to initialize: {e}")
+            from .core.spatial_engine import close_shared_connections
+            close_shared_connections(abs_path)
             if os.path.exists(abs_path):
                 try:
                     os.remove(abs_path)
                 except OSError as e:
                     print(f"Warning: Could not delete project DB {abs_path}: {e}")
 
+    @_synchronized
     def update_project_base_layers(self, project_id, layer_names):
         """Persist base layer names (list of str) to projects.base_layer_names as JSON."""
-        cursor = self.connection.cursor()
-        cursor.execute(
-            "UPDATE projects SET base_layer_names = ? WHERE id = ?",
-            (json.dumps(layer_names), project_id)
-        )
-        self.connection.commit()
-        cursor.close()
+        self._project_cache.pop(project_id, None)
+        with self.transaction():
+            self.connection.execute(
+                "UPDATE projects SET base_layer_names = ? WHERE id = ?",
+                (_dumps_list(layer_names), project_id)
+            )
 
     # ------------------------------------------------------------------ #
     #  Assessments CRUD
     # ------------------------------------------------------------------ #
 
+    @_synchronized
     def create_assessment(self, project_id, name, description="",
                           target_layer="", spatial_extent="",
                           assessment_layers=None, output_tables=None):
@@ -358,272 +828,315 @@ class AdminManager:
         assessment_layers and output_tables are optional lists that get
         recorded in the normalized assessment_layers table.
         """
-        assessment_uuid = str(uuid.uuid4())
-
-        cursor = self.connection.cursor()
-        cursor.execute(
-            """INSERT INTO assessments
-               (uuid, project_id, name, description, target_layer, spatial_extent)
-               VALUES (?, ?, ?, ?, ?, ?)""",
-            (assessment_uuid, project_id, name, description, target_layer, spatial_extent)
-        )
-        self.connection.commit()
-        assessment_id = cursor.lastrowid
-        cursor.close()
+        assessment_uuid = _new_id()
+
+        # Assessment row + all its layers are written in one transaction
+        # (single commit) instead of one commit per layer.
+        with self.transaction():
+            cursor = self.connection.execute(
+                _SQL_INSERT_ASSESSMENT,
+                (assessment_uuid, project_id, name, description, target_layer, spatial_extent)
+            )
+            assessment_id = cursor.lastrowid
 
-        # Record input layers
-        if assessment_layers:
-            for layer_name in assessment_layers:
-                self.add_assessment_layer(assessment_id, layer_name, 'input')
+            rows = [(assessment_id, n, 'input', '') for n in (assessment_layers or [])]
+            rows += [(assessment_id, n, 'output', '') for n in (output_tables or [])]
+            if rows:
+                self.connection.executemany(_SQL_INSERT_ASSESSMENT_LAYER, rows)
 
-        # Record output layers
-        if output_tables:
-            for layer_name in output_tables:
-                self.add_assessment_layer(assessment_id, layer_name, 'output')
+            # Inside the block: a rollback clears the name cache again
+            names = self._name_cache.get(project_id)
+            if names is not None:
+                names.add(name)
 
         return assessment_id
 
+    def _bulk_insert_assessments(self, rows, layer_lists):
+        """Insert many assessments and their layers with executemany.
+
+        Args:
+            rows: list of (uuid, project_id, name, description,
+                  target_layer, spatial_extent) tuples
+            layer_lists: list of (input_layers, output_tables), parallel to rows
+
+        Returns:
+            list[int]: new assessment ids, in the order of rows.
+        """
+        if not rows:
+            return []
+        with self.transaction():
+            uuids = [r[0] for r in rows]
+            if _HAS_RETURNING:
+                id_by_uuid = dict(self.connection.execute(
+                    _SQL_BULK_INSERT_ASSESSMENTS, (json.dumps(rows),)
+                ))
+            else:
+                self.connection.executemany(_SQL_INSERT_ASSESSMENT, rows)
+                id_by_uuid = dict(self.connection.execute(
+                    _SQL_ASSESSMENT_IDS_BY_UUIDS, (json.dumps(uuids),)
+                ))
+            assessment_ids = [id_by_uuid[u] for u in uuids]
+
+            layer_rows = []
+            for aid, (input_layers, output_tables) in zip(assessment_ids, layer_lists):
+                layer_rows += [(aid, n, 'input', '') for n in input_layers]
+                layer_rows += [(aid, n, 'output', '') for n in output_tables]
+            if layer_rows:
+                self.connection.executemany(_SQL_INSERT_ASSESSMENT_LAYER, layer_rows)
+            for r in rows:
+                self._name_cache.pop(r[1], None)
+        return assessment_ids
+
+    @_synchronized
     def get_assessments_for_project(self, project_id):
         """Return list of assessment dicts for a given project (non-deleted only)."""
-        cursor = self.connection.cursor()
-        cursor.execute(
-            """SELECT id, uuid, project_id, name, description,
-                      target_layer, spatial_extent, created_at
-               FROM assessments
-               WHERE project_id = ? AND is_deleted = 0
-               ORDER BY name""",
-            (project_id,)
-        )
-        rows = cursor.fetchall()
-        cursor.close()
-
         assessments = []
-        for r in rows:
-            assessment_id = r[0]
-            output_layers = self.get_assessment_layers(assessment_id, layer_type='output')
-            output_tables = [l['layer_name'] for l in output_layers]
-            assessments.append({
-                'id': r[0], 'uuid': r[1], 'project_id': r[2],
-                'name': r[3], 'description': r[4],
-                'target_layer': r[5], 'spatial_extent': r[6],
-                'created_at': r[7],
-                'output_tables': output_tables
-            })
+        for r in self.connection.execute(_SQL_ASSESSMENTS_FOR_PROJECT, (project_id,)):
+            assessment = dict(r)
+            joined = assessment['output_tables']
+            assessment['output_tables'] = joined.split('\x1f') if joined else []
+            assessments.append(assessment)
         return assessments
 
+    @_synchronized
     def get_assessment(self, assessment_id):
         """Return a single assessment dict by ID, or None."""
-        cursor = self.connection.cursor()
-        cursor.execute(
-            """SELECT id, uuid, project_id, name, description,
-                      target_layer, spatial_extent, created_at
-               FROM assessments
-               WHERE id = ? AND is_deleted = 0""",
-            (assessment_id,)
-        )
-        row = cursor.fetchone()
-        cursor.close()
-        if not row:
-            return None
-        return {
-            'id': row[0], 'uuid': row[1], 'project_id': row[2],
-            'name': row[3], 'description': row[4],
-            'target_layer': row[5], 'spatial_extent': row[6],
-            'created_at': row[7],
-        }
+        row = self.connection.execute(
+            _SQL_ASSESSMENT_BY_ID, (assessment_id,)
+        ).fetchone()
+        return dict(row) if row else None
+
+    def _assessment_names(self, project_id):
+        """Cached set of assessment names under a project (do not mutate)."""
+        names = self._name_cache.get(project_id)
+        if names is None:
+            names = self._name_cache[project_id] = {
+                r[0] for r in self.connection.execute(_SQL_ASSESSMENT_NAMES, (project_id,))
+            }
+        return names
 
+    @_synchronized
     def assessment_name_exists(self, project_id, assessment_name):
-        """Return True if an assessment with this name exists under this project."""
-        cursor = self.connection.cursor()
-        cursor.execute(
-            "SELECT 1 FROM assessments WHERE project_id = ? AND name = ?",
-            (project_id, assessment_name)
-        )
-        exists = cursor.fetchone() is not None
-        cursor.close()
-        return exists
+        """Return True if an assessment with this name exists under this project.
+
+        Answered from an in-memory name set after the first call per project,
+        so the wizard can validate names without a query each time.
+        """
+        return assessment_name in self._assessment_names(project_id)
 
+    @_synchronized
     def delete_assessment(self, assessment_id):
         """Soft-delete a single assessment (is_deleted = 1)."""
-        cursor = self.connection.cursor()
-        cursor.execute(
-            "UPDATE assessments SET is_deleted = 1 WHERE id = ?", (assessment_id,)
-        )
-        self.connection.commit()
-        cursor.close()
+        with self.transaction():
+            self.connection.execute(
+                "UPDATE assessments SET is_deleted = 1 WHERE id = ?", (assessment_id,)
+            )
 
+    @_synchronized
     def purge_assessment(self, assessment_id):
         """Permanently delete an assessment record (cascades to layers, visibility, steps)."""
-        cursor = self.connection.cursor()
-        cursor.execute("DELETE FROM assessments WHERE id = ?", (assessment_id,))
-        self.connection.commit()
-        cursor.close()
+        with self.transaction():
+            self.connection.execute("DELETE FROM assessments WHERE id = ?", (assessment_id,))
+            # Project unknown here; the name is free again
+            self._name_cache.clear()
 
     # ------------------------------------------------------------------ #
     #  Assessment Layers
     # ------------------------------------------------------------------ #
 
+    @_synchronized
     def add_assessment_layer(self, assessment_id, layer_name, layer_type, geometry_type=""):
         """Record a layer associated with an assessment."""
-        cursor = self.connection.cursor()
-        cursor.execute(
-            """INSERT INTO assessment_layers (assessment_id, layer_name, layer_type, geometry_type)
-               VALUES (?, ?, ?, ?)""",
-            (assessment_id, layer_name, layer_type, geometry_type)
-        )
-        self.connection.commit()
-        cursor.close()
+        with self.transaction():
+            self._cursor.execute(
+                _SQL_INSERT_ASSESSMENT_LAYER,
+                (assessment_id, layer_name, layer_type, geometry_type)
+            )
 
+    @_synchronized
+    def add_assessment_layers(self, assessment_id, layer_names, layer_type,
+                              geometry_type=""):
+        """Record several layers of one type with a single executemany."""
+        rows = [(assessment_id, n, layer_type, geometry_type) for n in layer_names]
+        if not rows:
+            return
+        with self.transaction():
+            self._cursor.executemany(_SQL_INSERT_ASSESSMENT_LAYER, rows)
+
+    @_synchronized
     def get_assessment_layers(self, assessment_id, layer_type=None):
         """Return list of layer dicts. Filter by layer_type if provided."""
-        cursor = self.connection.cursor()
         if layer_type:
-            cursor.execute(
-                """SELECT id, assessment_id, layer_name, layer_type, geometry_type
-                   FROM assessment_layers
-                   WHERE assessment_id = ? AND layer_type = ?""",
-                (assessment_id, layer_type)
-            )
+            rows = self.connection.execute(
+                _SQL_ASSESSMENT_LAYERS_BY_TYPE, (assessment_id, layer_type)
+            ).fetchall()
         else:
-            cursor.execute(
-                """SELECT id, assessment_id, layer_name, layer_type, geometry_type
-                   FROM assessment_layers WHERE assessment_id = ?""",
-                (assessment_id,)
-            )
-        rows = cursor.fetchall()
-        cursor.close()
-        return [
-            {
-                'id': r[0], 'assessment_id': r[1], 'layer_name': r[2],
-                'layer_type': r[3], 'geometry_type': r[4]
-            }
-            for r in rows
+            rows = self.connection.execute(
+                _SQL_ASSESSMENT_LAYERS, (assessment_id,)
+            ).fetchall()
+        return [dict(r) for r in rows]
+
+    @_synchronized
+    def get_rerun_context(self, assessment_id):
+        """Return everything a re-run needs, read with one query.
+
+        Returns:
+            dict or None: { assessment, input_layers, project_db_path }, where
+            assessment matches get_assessment(), input_layers matches
+            get_assessment_layers(assessment_id, 'input') and project_db_path
+            matches get_project_db_path(). None if the assessment is not found.
+        """
+        rows = self.connection.execute(
+            _SQL_RERUN_CONTEXT, (assessment_id,)
+        ).fetchall()
+        if not rows:
+            return None
+
+        first = rows[0]
+        assessment = {k: first[k] for k in (
+            'id', 'uuid', 'project_id', 'name', 'description',
+            'target_layer', 'spatial_extent', 'created_at',
+        )}
+        input_layers = [
+            {'id': r['layer_id'], 'assessment_id': assessment_id,
+             'layer_name': r['layer_name'], 'layer_type': r['layer_type'],
+             'geometry_type': r['geometry_type']}
+            for r in rows if r['layer_id'] is not None
         ]
+        project_db_path = None
+        if first['db_path']:
+            project_db_path = os.path.join(self.plugin_dir, first['db_path'])
+            self._wait_for_project_db(project_db_path)
+        return {
+            'assessment': assessment,
+            'input_layers': input_layers,
+            'project_db_path': project_db_path,
+        }
 
+    @_synchronized
     def remove_assessment_layers(self, assessment_id):
         """Remove all layers for an assessment."""
-        cursor = self.connection.cursor()
-        cursor.execute("DELETE FROM assessment_layers WHERE assessment_id = ?", (assessment_id,))
-        self.connection.commit()
-        cursor.close()
+        with self.transaction():
+            self.connection.execute("DELETE FROM assessment_layers WHERE assessment_id = ?", (assessment_id,))
 
     # ------------------------------------------------------------------ #
     #  Layer Visibility State
     # ------------------------------------------------------------------ #
 
+    @_synchronized
     def set_layer_visibility(self, assessment_id, layer_name, visible):
-        """Persist layer visibility state (INSERT OR REPLACE)."""
-        cursor = self.connection.cursor()
-        cursor.execute(
-            """INSERT OR REPLACE INTO layer_visibility_state
-               (assessment_id, layer_name, visible) VALUES (?, ?, ?)""",
-            (assessment_id, layer_name, 1 if visible else 0)
-        )
-        self.connection.commit()
-        cursor.close()
+        """Persist layer visibility state (upsert)."""
+        with self.transaction():
+            self._cursor.execute(
+                _SQL_UPSERT_VISIBILITY,
+                (assessment_id, layer_name, 1 if visible else 0)
+            )
+
+    @_synchronized
+    def set_layer_visibilities(self, assessment_id, pairs):
+        """Persist visibility for many layers in one transaction.
 
+        Args:
+            assessment_id: int
+            pairs: iterable of (layer_name, visible) tuples
+        """
+        with self.transaction():
+            self.connection.executemany(
+                _SQL_UPSERT_VISIBILITY,
+                [(assessment_id, name, 1 if visible else 0)
+                 for name, visible in pairs]
+            )
+
+    @_synchronized
     def get_layer_visibility(self, assessment_id):
         """Return dict {layer_name: bool} for all persisted visibility states."""
-        cursor = self.connection.cursor()
-        cursor.execute(
-            "SELECT layer_name, visible FROM layer_visibility_state WHERE assessment_id = ?",
-            (assessment_id,)
-        )
-        rows = cursor.fetchall()
-        cursor.close()
+        rows = self.connection.execute(
+            _SQL_LAYER_VISIBILITY, (assessment_id,)
+        ).fetchall()
         return {r[0]: bool(r[1]) for r in rows}
 
+    @_synchronized
     def get_visible_layers(self, assessment_id):
         """Return list of layer names that are visible."""
-        cursor = self.connection.cursor()
-        cursor.execute(
-            "SELECT layer_name FROM layer_visibility_state WHERE assessment_id = ? AND visible = 1",
-            (assessment_id,)
-        )
-        rows = cursor.fetchall()
-        cursor.close()
+        rows = self.connection.execute(
+            _SQL_VISIBLE_LAYERS, (assessment_id,)
+        ).fetchall()
         return [r[0] for r in rows]
 
     # ------------------------------------------------------------------ #
     #  Workflow Steps
     # ------------------------------------------------------------------ #
 
+    @_synchronized
     def add_workflow_step(self, assessment_id, step_order, operation, parameters=""):
         """Record a workflow step for an assessment."""
-        cursor = self.connection.cursor()
-        cursor.execute(
-            """INSERT INTO workflow_steps (assessment_id, step_order, operation, parameters)
-               VALUES (?, ?, ?, ?)""",
-            (assessment_id, step_order, operation, parameters)
-        )
-        self.connection.commit()
-        cursor.close()
+        with self.transaction():
+            self.connection.execute(
+                """INSERT INTO workflow_steps (assessment_id, step_order, operation, parameters)
+                   VALUES (?, ?, ?, ?)""",
+                (assessment_id, step_order, operation, parameters)
+            )
 
+    @_synchronized
     def get_workflow_steps(self, assessment_id):
         """Return list of workflow step dicts ordered by step_order."""
-        cursor = self.connection.cursor()
-        cursor.execute(
-            """SELECT id, assessment_id, step_order, operation, parameters, created_at
-               FROM workflow_steps WHERE assessment_id = ? ORDER BY step_order""",
-            (assessment_id,)
-        )
-        rows = cursor.fetchall()
-        cursor.close()
-        return [
-            {
-                'id': r[0], 'assessment_id': r[1], 'step_order': r[2],
-                'operation': r[3], 'parameters': r[4], 'created_at': r[5]
-            }
-            for r in rows
-        ]
+        rows = self.connection.execute(
+            _SQL_WORKFLOW_STEPS, (assessment_id,)
+        ).fetchall()
+        return [dict(r) for r in rows]
 
     # ------------------------------------------------------------------ #
     #  Provenance CRUD
     # ------------------------------------------------------------------ #
 
+    @_synchronized
     def create_provenance(self, assessment_id, name, description=""):
         """Insert a new provenance record. Returns the new provenance id."""
-        prov_uuid = str(uuid.uuid4())
-        cursor = self.connection.cursor()
-        cursor.execute(
-            """INSERT INTO provenance (uuid, assessment_id, name, description)
-               VALUES (?, ?, ?, ?)""",
-            (prov_uuid, assessment_id, name, description)
-        )
-        self.connection.commit()
-        prov_id = cursor.lastrowid
-        cursor.close()
+        prov_uuid = _new_id()
+        with self.transaction():
+            cursor = self.connection.execute(
+                """INSERT INTO provenance (uuid, assessment_id, name, description)
+                   VALUES (?, ?, ?, ?)""",
+                (prov_uuid, assessment_id, name, description)
+            )
+            prov_id = cursor.lastrowid
         return prov_id
 
+    @_synchronized
+    def create_provenance_with_task(self, assessment_id, name, description="",
+                                    **task_fields):
+        """Insert a provenance record and its first task in one commit.
+
+        task_fields are add_task() keyword arguments (step_order and
+        operation are required); provenance_id is filled in here.
+
+        Returns:
+            tuple: (provenance_id, task_id)
+        """
+        with self.transaction():
+            provenance_id = self.create_provenance(assessment_id, name, description)
+            task_id = self.add_task(provenance_id=provenance_id, **task_fields)
+        return provenance_id, task_id
+
+    @_synchronized
     def get_provenance_for_assessment(self, assessment_id):
         """Return list of provenance dicts for an assessment, ordered by creation."""
-        cursor = self.connection.cursor()
-        cursor.execute(
-            """SELECT id, uuid, assessment_id, name, description, created_at
-               FROM provenance WHERE assessment_id = ? ORDER BY created_at""",
-            (assessment_id,)
-        )
-        rows = cursor.fetchall()
-        cursor.close()
-        return [
-            {
-                'id': r[0], 'uuid': r[1], 'assessment_id': r[2],
-                'name': r[3], 'description': r[4], 'created_at': r[5]
-            }
-            for r in rows
-        ]
+        rows = self.connection.execute(
+            _SQL_PROVENANCE_FOR_ASSESSMENT, (assessment_id,)
+        ).fetchall()
+        return [dict(r) for r in rows]
 
+    @_synchronized
     def delete_provenance(self, provenance_id):
         """Delete a provenance record (cascades to task_details)."""
-        cursor = self.connection.cursor()
-        cursor.execute("DELETE FROM provenance WHERE id = ?", (provenance_id,))
-        self.connection.commit()
-        cursor.close()
+        with self.transaction():
+            self.connection.execute("DELETE FROM provenance WHERE id = ?", (provenance_id,))
 
     # ------------------------------------------------------------------ #
     #  Task Details CRUD
     # ------------------------------------------------------------------ #
 
+    @_synchronized
     def add_task(self, provenance_id, step_order, operation,
                  parent_task_id=None, input_tables=None, output_tables=None,
                  category="", engine_type="spatialite", duration_ms=0,
@@ -633,7 +1146,7 @@ class AdminManager:
         Args:
             provenance_id: int
             step_order: int
-            operation: str  e.g. 'union+intersect', 'CDP', 'NetWeaver'
+            operation: str  e.g. 'union', 'CDP', 'NetWeaver'
             parent_task_id: int or None (None = top-level task)
             input_tables: list of str  (serialized to JSON)
             output_tables: list of str (serialized to JSON)
@@ -645,67 +1158,61 @@ class AdminManager:
             added_to_map: bool
             is_scenario: bool  True for what-if / alternate-scenario runs
         """
-        task_uuid = str(uuid.uuid4())
-        input_json = json.dumps(input_tables) if input_tables is not None else ''
-        output_json = json.dumps(output_tables) if output_tables is not None else ''
-
-        cursor = self.connection.cursor()
-        cursor.execute(
-            """INSERT INTO task_details
-               (uuid, provenance_id, parent_task_id, step_order, operation,
-                category, input_tables, output_tables, added_to_map,
-                duration_ms, parameters, comments, engine_type, is_scenario)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (task_uuid, provenance_id, parent_task_id, step_order, operation,
-             category, input_json, output_json, 1 if added_to_map else 0,
-             duration_ms, parameters, comments,
-             engine_type, 1 if is_scenario else 0)
-        )
-        self.connection.commit()
-        task_id = cursor.lastrowid
-        cursor.close()
+        task_uuid = _new_id()
+        input_json = _dumps_list(input_tables)
+        output_json = _dumps_list(output_tables)
+
+        with self.transaction():
+            cursor = self.connection.execute(
+                """INSERT INTO task_details
+                   (uuid, provenance_id, parent_task_id, step_order, operation,
+                    category, input_tables, output_tables, added_to_map,
+                    duration_ms, parameters, comments, engine_type, is_scenario)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (task_uuid, provenance_id, parent_task_id, step_order, operation,
+                 category, input_json, output_json, 1 if added_to_map else 0,
+                 duration_ms, parameters, comments,
+                 engine_type, 1 if is_scenario else 0)
+            )
+            task_id = cursor.lastrowid
         return task_id
 
+    def iter_tasks_for_provenance(self, provenance_id):
+        """Yield task dicts for a provenance, ordered by step_order.
+
+        The rows are read in one go under the connection lock: a cursor
+        left open between batches would share the connection with other
+        threads' statements and commits. Rows become dicts as they are
+        consumed.
+        """
+        with self._lock:
+            rows = self.connection.execute(
+                _SQL_TASKS_FOR_PROVENANCE, (provenance_id,)
+            ).fetchall()
+        yield from map(self._row_to_task, rows)
+
     def get_tasks_for_provenance(self, provenance_id):
         """Return all task dicts for a provenance, ordered by step_order."""
-        cursor = self.connection.cursor()
-        cursor.execute(
-            """SELECT id, uuid, provenance_id, parent_task_id, step_order, operation,
-                      category, input_tables, output_tables, db_type, added_to_map,
-                      scenario, duration_ms, parameters, comments, created_at,
-                      engine_type, is_scenario
-               FROM task_details WHERE provenance_id = ? ORDER BY step_order""",
-            (provenance_id,)
-        )
-        rows = cursor.fetchall()
-        cursor.close()
-        return [self._row_to_task(r) for r in rows]
+        return list(self.iter_tasks_for_provenance(provenance_id))
 
+    @_synchronized
     def get_child_tasks(self, parent_task_id):
         """Return task dicts that are direct children of the given task."""
-        cursor = self.connection.cursor()
-        cursor.execute(
-            """SELECT id, uuid, provenance_id, parent_task_id, step_order, operation,
-                      category, input_tables, output_tables, db_type, added_to_map,
-                      scenario, duration_ms, parameters, comments, created_at,
-                      engine_type, is_scenario
-               FROM task_details WHERE parent_task_id = ? ORDER BY step_order""",
-            (parent_task_id,)
-        )
-        rows = cursor.fetchall()
-        cursor.close()
+        rows = self.connection.execute(
+            _SQL_CHILD_TASKS, (parent_task_id,)
+        ).fetchall()
         return [self._row_to_task(r) for r in rows]
 
+    @_synchronized
     def update_task_duration(self, task_id, duration_ms):
         """Update the duration_ms field for a task."""
-        cursor = self.connection.cursor()
-        cursor.execute(
-            "UPDATE task_details SET duration_ms = ? WHERE id = ?",
-            (duration_ms, task_id)
-        )
-        self.connection.commit()
-        cursor.close()
+        with self.transaction():
+            self.connection.execute(
+                "UPDATE task_details SET duration_ms = ? WHERE id = ?",
+                (duration_ms, task_id)
+            )
 
+    @_synchronized
     def build_task_tree(self, provenance_id):
         """Return top-level tasks with nested 'children' lists.
 
@@ -713,34 +1220,36 @@ class AdminManager:
             list[dict]: Each dict is a task with a 'children' key containing
                         its child tasks recursively.
         """
-        all_tasks = self.get_tasks_for_provenance(provenance_id)
-        task_map = {t['id']: dict(t, children=[]) for t in all_tasks}
+        rows = self.connection.execute(_SQL_TASK_TREE, (provenance_id,))
+
+        # Rows arrive in sibling order, so appending keeps every children
+        # list sorted. Tasks whose parent is not in this provenance are roots.
+        tasks = {}
+        for r in rows:
+            task = self._row_to_task(r)
+            task['children'] = []
+            tasks[task['id']] = task
         roots = []
-        for t in task_map.values():
-            pid = t.get('parent_task_id')
-            if pid and pid in task_map:
-                task_map[pid]['children'].append(t)
+        for task in tasks.values():
+            parent = tasks.get(task['parent_task_id'])
+            if parent is not None:
+                parent['children'].append(task)
             else:
-                roots.append(t)
+                roots.append(task)
         return roots
 
     def _row_to_task(self, r):
-        """Convert a task_details DB row tuple to a dict."""
-        return {
-            'id': r[0], 'uuid': r[1], 'provenance_id': r[2],
-            'parent_task_id': r[3], 'step_order': r[4], 'operation': r[5],
-            'category': r[6], 'input_tables': r[7], 'output_tables': r[8],
-            'db_type': r[9], 'added_to_map': bool(r[10]),
-            'scenario': r[11], 'duration_ms': r[12],
-            'parameters': r[13], 'comments': r[14], 'created_at': r[15],
-            'engine_type': r[16] if len(r) > 16 else 'spatialite',
-            'is_scenario': bool(r[17]) if len(r) > 17 else False,
-        }
+        """Convert a task_details sqlite3.Row to a dict."""
+        task = dict(r)
+        task['added_to_map'] = bool(task['added_to_map'])
+        task['is_scenario'] = bool(task['is_scenario'])
+        return task
 
     # ------------------------------------------------------------------ #
     #  Spatial References CRUD  (EMDS 8 adaptation)
     # ------------------------------------------------------------------ #
 
+    @_synchronized
     def create_spatial_reference(self, assessment_id, name,
                                   overlay_layer_name="", source_tables=None,
                                   source_db_type="spatialite", source_db_path="",
@@ -756,89 +1265,83 @@ class AdminManager:
             source_db_path: str — path or connection string
             srid: int — EPSG code
         """
-        sr_uuid = str(uuid.uuid4())
-        source_json = json.dumps(source_tables) if source_tables is not None else ''
-
-        cursor = self.connection.cursor()
-        cursor.execute(
-            """INSERT INTO spatial_references
-               (uuid, assessment_id, name, overlay_layer_name,
-                source_tables, source_db_type, source_db_path, srid)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-            (sr_uuid, assessment_id, name, overlay_layer_name,
-             source_json, source_db_type, source_db_path, srid)
-        )
-        self.connection.commit()
-        sr_id = cursor.lastrowid
-        cursor.close()
+        sr_uuid = _new_id()
+        source_json = _dumps_list(source_tables) or None  # NULL when empty
+
+        with self.transaction():
+            cursor = self.connection.execute(
+                """INSERT INTO spatial_references
+                   (uuid, assessment_id, name, overlay_layer_name,
+                    source_tables, source_db_type, source_db_path, srid)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                (sr_uuid, assessment_id, name, overlay_layer_name,
+                 source_json, source_db_type, source_db_path, srid)
+            )
+            sr_id = cursor.lastrowid
         return sr_id
 
+    @_synchronized
     def get_spatial_references_for_assessment(self, assessment_id):
-        """Return list of spatial_reference dicts for an assessment."""
-        cursor = self.connection.cursor()
-        cursor.execute(
-            """SELECT id, uuid, assessment_id, name, overlay_layer_name,
-                      source_tables, source_db_type, source_db_path, srid, created_at
-               FROM spatial_references WHERE assessment_id = ? ORDER BY created_at""",
-            (assessment_id,)
-        )
-        rows = cursor.fetchall()
-        cursor.close()
-        return [
-            {
-                'id': r[0], 'uuid': r[1], 'assessment_id': r[2],
-                'name': r[3], 'overlay_layer_name': r[4],
-                'source_tables': r[5], 'source_db_type': r[6],
-                'source_db_path': r[7], 'srid': r[8], 'created_at': r[9]
-            }
-            for r in rows
-        ]
+        """Return list of spatial_reference dicts for an assessment.
+
+        'source_tables' is returned as a list of table names.
+        """
+        rows = self.connection.execute(
+            _SQL_SPATIAL_REFERENCES, (assessment_id,)
+        ).fetchall()
+        refs = []
+        for r in rows:
+            ref = dict(r)
+            raw = ref['source_tables']
+            ref['source_tables'] = json.loads(raw) if raw else []
+            refs.append(ref)
+        return refs
 
     # ------------------------------------------------------------------ #
     #  App Settings  (EMDS 8 adaptation)
     # ------------------------------------------------------------------ #
 
+    @_synchronized
     def get_app_setting(self, key, default=None):
         """Return a value from the app_settings row (column = key).
 
         Valid keys: plugin_version, default_project_dir, default_base_layers_group,
                     output_group_name, symbology_defaults, misc
         """
-        cursor = self.connection.cursor()
-        try:
-            cursor.execute(f'SELECT "{key}" FROM app_settings WHERE id = 1')
-            row = cursor.fetchone()
-            return row[0] if row else default
-        except Exception:
+        sql = _APP_SETTING_SQL.get(key)
+        if sql is None:
             return default
-        finally:
-            cursor.close()
+        row = self.connection.execute(sql[0]).fetchone()
+        return row[0] if row else default
 
+    @_synchronized
     def set_app_setting(self, key, value):
         """Update a single column in the app_settings row."""
-        cursor = self.connection.cursor()
-        try:
-            cursor.execute(
-                f'UPDATE app_settings SET "{key}" = ? WHERE id = 1', (value,)
-            )
-            self.connection.commit()
-        finally:
-            cursor.close()
+        sql = _APP_SETTING_SQL.get(key)
+        if sql is None:
+            raise ValueError(f"Unknown app setting: '{key}'")
+        with self.transaction():
+            self.connection.execute(sql[1], (value,))
 
     # ------------------------------------------------------------------ #
     #  Utilities
     # ------------------------------------------------------------------ #
 
+    @_synchronized
     def get_project_db_path(self, project_id):
         """Return absolute path to the project's SpatiaLite database."""
-        project = self.get_project(project_id)
+        project = self._project_cache.get(project_id) or self.get_project(project_id)
         if project:
-            return os.path.join(self.plugin_dir, project['db_path'])
+            abs_db_path = os.path.join(self.plugin_dir, project['db_path'])
+            self._wait_for_project_db(abs_db_path)
+            return abs_db_path
         return None
 
-    def _sanitize_name(self, name):
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _sanitize_name(name):
         """Convert a name to a filesystem-safe string."""
-        sanitized = re.sub(r'[^a-zA-Z0-9_]', '_', name)
+        sanitized = name.translate(_SANITIZE_TABLE)
         sanitized = sanitized.lower().strip('_')
         return sanitized if sanitized else 'unnamed'
 
@@ -846,6 +1349,7 @@ class AdminManager:
     #  Migration from metadata.db
     # ------------------------------------------------------------------ #
 
+    @_synchronized
     def migrate_from_metadata_db(self, old_db_path):
         """Migrate data from old metadata.db to the new admin.sqlite schema.
 
@@ -866,24 +1370,10 @@ class AdminManager:
         try:
             old_cursor = old_conn.cursor()
 
-            # Migrate projects
+            # Read old projects and assessments
             old_cursor.execute("SELECT id, name, description FROM projects ORDER BY id")
             old_projects = old_cursor.fetchall()
 
-            project_id_map = {}  # old_id → new_id
-
-            for old_id, name, description in old_projects:
-                # Skip if project already exists
-                if self.get_project_by_name(name):
-                    existing = self.get_project_by_name(name)
-                    project_id_map[old_id] = existing['id']
-                    continue
-
-                new_id = self.create_project(name, description or "")
-                project_id_map[old_id] = new_id
-                stats['projects_migrated'] += 1
-
-            # Migrate assessments
             old_cursor.execute(
                 """SELECT id, project_id, name, description, target_layer,
                           assessment_layers, output_tables
@@ -891,38 +1381,69 @@ class AdminManager:
             )
             old_assessments = old_cursor.fetchall()
 
-            for old_id, old_project_id, name, description, target_layer, \
-                    assessment_layers_json, output_tables_json in old_assessments:
+            # One urandom read for every UUID the migration may need
+            new_ids = _new_ids(len(old_projects) + len(old_assessments))
 
-                new_project_id = project_id_map.get(old_project_id)
-                if new_project_id is None:
-                    continue
+            project_id_map = {}  # old_id → new_id
+            new_projects = {}    # name → (uuid, name, description, db_path)
+            pending = []         # (old_id, name) resolved after the insert
 
-                # Skip if assessment already exists
-                if self.assessment_name_exists(new_project_id, name):
-                    continue
+            # Every existing name, soft-deleted included (name is UNIQUE)
+            existing = dict(self.connection.execute(_SQL_ALL_PROJECT_IDS))
 
-                # Parse JSON fields from old schema
-                input_layers = []
-                output_tables = []
-                try:
-                    input_layers = json.loads(assessment_layers_json) if assessment_layers_json else []
-                except (json.JSONDecodeError, TypeError):
-                    pass
-                try:
-                    output_tables = json.loads(output_tables_json) if output_tables_json else []
-                except (json.JSONDecodeError, TypeError):
-                    pass
-
-                self.create_assessment(
-                    project_id=new_project_id,
-                    name=name,
-                    description=description or "",
-                    target_layer=target_layer or "",
-                    assessment_layers=input_layers,
-                    output_tables=output_tables
-                )
-                stats['assessments_migrated'] += 1
+            for old_id, name, description in old_projects:
+                # Skip if project already exists
+                if name in existing:
+                    project_id_map[old_id] = existing[name]
+                    continue
+                if name not in new_projects:
+                    new_projects[name] = (
+                        next(new_ids), name, description or "",
+                        self._project_db_relpath(name)
+                    )
+                pending.append((old_id, name))
+
+            # All inserts share one transaction (one commit for the whole run)
+            with self.transaction():
+                name_to_id = self._bulk_insert_projects(list(new_projects.values()))
+                for old_id, name in pending:
+                    project_id_map[old_id] = name_to_id[name]
+                stats['projects_migrated'] = len(new_projects)
+
+                assessment_rows = []
+                layer_lists = []
+                # (project_id, name) already taken, soft-deleted included
+                taken = {
+                    tuple(r) for r in self.connection.execute(_SQL_ALL_ASSESSMENT_KEYS)
+                }
+                for old_id, old_project_id, name, description, target_layer, \
+                        assessment_layers_json, output_tables_json in old_assessments:
+
+                    new_project_id = project_id_map.get(old_project_id)
+                    if new_project_id is None:
+                        continue
+
+                    # Skip if assessment already exists
+                    key = (new_project_id, name)
+                    if key in taken:
+                        continue
+                    taken.add(key)
+
+                    # Parse JSON fields from old schema
+                    input_layers = _parse_json_list(assessment_layers_json)
+                    output_tables = _parse_json_list(output_tables_json)
+
+                    assessment_rows.append((
+                        next(new_ids), new_project_id, name, description or "",
+                        target_layer or "", ""
+                    ))
+                    layer_lists.append((input_layers, output_tables))
+
+                self._bulk_insert_assessments(assessment_rows, layer_lists)
+                stats['assessments_migrated'] = len(assessment_rows)
+
+            for _, _, _, db_path in new_projects.values():
+                self._start_project_db_init(db_path)
 
             old_cursor.close()
 
@@ -18,14 +18,57 @@ UI layer → AssessmentExecutor (this file)
            Infrastructure
 """
 
+import logging
+import sqlite3
+
+from qgis.PyQt.QtCore import QTimer
 from qgis.PyQt.QtWidgets import QMessageBox
+from qgis.core import QgsApplication
 
 from .core.application import (
     CreateScenarioCommand, CreateScenario,
-    ApplyOverlayCommand,   ApplyOverlay,
+    ApplyOverlayCommand,   ApplyOverlay,   make_base_names,
     RollbackVersionCommand, RollbackVersion,
     CompareVersionsCommand, CompareVersions,
+    OverlayTask,
 )
+from .core.spatial_engine import sanitize_table_name
+
+_log = logging.getLogger(__name__)
+
+# Result dialogs list at most this many table names inline; the full list
+# goes behind "Show Details..."
+_BULLET_LIMIT = 10
+
+
+def _bullet_list(names, limit=_BULLET_LIMIT):
+    """Format names as one '• name' line each, for the result dialogs."""
+    text = "".join([f"\n• {name}" for name in names[:limit]])
+    if len(names) > limit:
+        text += f"\n… and {len(names) - limit} more"
+    return text
+
+
+def _show_tables(parent, title, text, names):
+    """Information box ending with a bullet list of table names.
+
+    Long lists are capped (see _BULLET_LIMIT) and given in full as the
+    box's detailed text.
+    """
+    box = QMessageBox(QMessageBox.Information, title,
+                      text + _bullet_list(names), QMessageBox.Ok, parent)
+    if len(names) > _BULLET_LIMIT:
+        box.setDetailedText("\n".join(names))
+    box.exec_()
+
+
+def _show_later(show, *args):
+    """Open a modal message box from the event loop, once the caller returns.
+
+    Used on task-completion paths so the task manager is not held up while
+    the dialog waits for the user.
+    """
+    QTimer.singleShot(0, lambda: show(*args))
 
 
 class AssessmentExecutor:
@@ -43,6 +86,19 @@ class AssessmentExecutor:
         self.project_id    = project_id
         self.admin_manager = admin_manager
         self.project_db_id = project_db_id
+        # use-case class -> instance, built on first use (see _use_case)
+        self._use_cases = {}
+
+    def _use_case(self, cls):
+        """Return this executor's instance of a use case, built on first use.
+
+        Built lazily (not in __init__) so a constructor error, e.g. a missing
+        admin_manager, still surfaces inside the caller's try block.
+        """
+        use_case = self._use_cases.get(cls)
+        if use_case is None:
+            use_case = self._use_cases[cls] = cls(self.admin_manager)
+        return use_case
 
     # ------------------------------------------------------------------ #
     #  Validation helper (used by the dialog before execution)
@@ -77,7 +133,7 @@ class AssessmentExecutor:
             target_layer=target_layer,
         )
         try:
-            result = CreateScenario(self.admin_manager).execute(cmd)
+            result = self._use_case(CreateScenario).execute(cmd)
         except ValueError as e:
             QMessageBox.warning(parent_widget, "Cannot Create Assessment", str(e))
             return None
@@ -87,7 +143,7 @@ class AssessmentExecutor:
             parent_widget,
             "Layer Created",
             f"Layer '{layer_name}' created successfully!\n\n"
-            f"Features: {len(list(target_layer.selectedFeatures()))}"
+            f"Features: {target_layer.selectedFeatureCount()}"
         )
         return result
 
@@ -114,17 +170,16 @@ class AssessmentExecutor:
             assessment_layers=assessment_layers,
         )
         try:
-            result = ApplyOverlay(self.admin_manager).execute(cmd)
+            result = self._use_case(ApplyOverlay).execute(cmd)
         except (ValueError, RuntimeError) as e:
             QMessageBox.critical(parent_widget, "Assessment Failed", str(e))
             return None
 
-        layer_names = "\n• ".join(result['output_tables'])
-        QMessageBox.information(
+        _show_tables(
             parent_widget,
             "Assessment Complete",
-            f"Assessment created successfully!\n\n"
-            f"Base layer(s):\n• {layer_names}"
+            "Assessment created successfully!\n\nBase layer(s):",
+            result['output_tables']
         )
         return result
 
@@ -132,88 +187,146 @@ class AssessmentExecutor:
     #  Case 2b: re-run spatial assessment (new version)
     # ------------------------------------------------------------------ #
 
-    def rerun_spatial_assessment(self, assessment_id, parent_widget=None):
+    def rerun_spatial_assessment(self, assessment_id, parent_widget=None,
+                                 on_finished=None):
         """Re-run overlay for an existing assessment, creating version n+1.
 
         Uses the stored target_layer and assessment_layers from admin.sqlite
         to re-execute the overlay on SpatiaLite tables that already exist.
+        The overlay SQL runs in a background OverlayTask, so this returns as
+        soon as the task is queued; results are recorded when it finishes.
+
+        Args:
+            on_finished: optional callable(result), called on the main
+                         thread when the task ends. result is
+                         { output_tables, version_ids, assessment_name }
+                         or None on failure.
 
         Returns:
-            dict or None: { output_tables, version_ids, assessment_name }
-                          or None on failure.
+            OverlayTask or None: the queued task, or None if validation
+                                 failed and nothing was queued.
         """
-        assessment = self.admin_manager.get_assessment(assessment_id)
-        if not assessment:
+        context = self.admin_manager.get_rerun_context(assessment_id)
+        if not context:
             QMessageBox.warning(parent_widget, "Error",
                                 "Assessment not found in metadata.")
             return None
 
-        input_layers = self.admin_manager.get_assessment_layers(
-            assessment_id, layer_type='input'
-        )
+        assessment = context['assessment']
+        input_layers = context['input_layers']
         if not input_layers:
             QMessageBox.warning(parent_widget, "Not Supported",
                                 "Only spatial assessments (with assessment layers) "
                                 "support versioning.")
             return None
 
-        project_db_path = self.admin_manager.get_project_db_path(self.project_db_id)
+        project_db_path = context['project_db_path']
         if not project_db_path:
             QMessageBox.critical(parent_widget, "Error",
                                  "Project database path not found.")
             return None
 
+        if OverlayTask.running_on(project_db_path):
+            QMessageBox.warning(parent_widget, "New Version",
+                                "A new version is already being created in "
+                                "this project. Try again once it finishes.")
+            return None
+
         target_layer_name = assessment['target_layer']
         assessment_name = assessment['name']
-        output_tables = []
-        version_ids = []
 
-        try:
-            from .core.spatial_engine import SpatialEngine
-            with SpatialEngine(project_db_path) as engine:
-                target_table = engine._repo.sanitize_name(target_layer_name)
-
-                for al in input_layers:
-                    assessment_table = engine._repo.sanitize_name(al['layer_name'])
-                    if len(input_layers) == 1:
-                        base_name = f"{self.project_id}__{assessment_name}"
-                    else:
-                        safe = al['layer_name'].replace(' ', '_')
-                        base_name = f"{self.project_id}__{assessment_name}_{safe}"
-
-                    result = engine.overlay(
-                        target_table, assessment_table, base_name,
-                        group_name="Output Layers",
-                    )
-                    output_tables.append(result['table'])
-                    version_ids.append(result['version_id'])
-
-        except (ValueError, RuntimeError) as e:
-            QMessageBox.critical(parent_widget, "New Version Failed", str(e))
-            return None
+        target_table = sanitize_table_name(target_layer_name)
 
-        # Record new output layers in admin.sqlite
-        for table_name in output_tables:
-            self.admin_manager.add_assessment_layer(
-                assessment_id, table_name, 'output'
+        # (assessment table, output base name) per input layer, built once
+        # before the overlays run
+        layer_names = [al['layer_name'] for al in input_layers]
+        base_names = make_base_names(
+            self.project_id, assessment_name, layer_names
+        )
+        plan = [
+            (sanitize_table_name(name), base_name)
+            for name, base_name in zip(layer_names, base_names)
+        ]
+
+        def _done(results, error):
+            result = self._on_rerun_finished(
+                assessment_id, assessment_name, target_layer_name,
+                input_layers, results, error, parent_widget,
             )
-            self.admin_manager.set_layer_visibility(assessment_id, table_name, True)
+            if on_finished:
+                on_finished(result)
 
-        # Record provenance
-        self._record_provenance(
-            assessment_id=assessment_id,
-            output_tables=output_tables,
-            target_layer_name=target_layer_name,
-            assessment_layer_names=[al['layer_name'] for al in input_layers]
+        task = OverlayTask(
+            f"New version: {assessment_name}", project_db_path,
+            target_table, plan, self.OUTPUT_GROUP_NAME, _done,
+            owner_alive=lambda: self.admin_manager.connection is not None,
         )
+        QgsApplication.taskManager().addTask(task)
+        return task
 
-        layer_names = "\n• ".join(output_tables)
-        QMessageBox.information(
-            parent_widget,
-            "New Version Created",
-            f"New version created successfully!\n\n"
-            f"Table(s):\n• {layer_names}"
-        )
+    def _on_rerun_finished(self, assessment_id, assessment_name,
+                           target_layer_name, input_layers, results, error,
+                           parent_widget):
+        """Record and report a finished re-run (main thread).
+
+        Versions that completed before an error are still recorded.
+        """
+        if error is not None:
+            _show_later(QMessageBox.critical, parent_widget,
+                        "New Version Failed", str(error))
+        if not results:
+            return None
+
+        output_tables = [r['table'] for r in results]
+        version_ids = [r['version_id'] for r in results]
+
+        # The form (and with it the admin connection) may have closed while
+        # the task ran; the new tables are then left unrecorded.
+        if self.admin_manager is None or self.admin_manager.connection is None:
+            _log.warning("Admin database closed; new version not recorded: %s",
+                         ", ".join(output_tables))
+            _show_later(QMessageBox.critical, parent_widget,
+                        "New Version Not Recorded",
+                        "The project was closed before the new version "
+                        "could be recorded.")
+            return None
+
+        # Record new output layers and provenance in admin.sqlite — one
+        # commit for the whole re-run.
+        try:
+            with self.admin_manager.transaction():
+                self.admin_manager.add_assessment_layers(
+                    assessment_id, output_tables, 'output'
+                )
+                self.admin_manager.set_layer_visibilities(
+                    assessment_id, [(t, True) for t in output_tables]
+                )
+
+                self._record_provenance(
+                    assessment_id=assessment_id,
+                    output_tables=output_tables,
+                    target_layer_name=target_layer_name,
+                    assessment_layer_names=[al['layer_name'] for al in input_layers]
+                )
+        except sqlite3.Error as e:
+            _log.warning("Could not record new version in metadata: %s", e)
+            _show_later(QMessageBox.critical, parent_widget,
+                        "New Version Not Recorded", str(e))
+            return None
+        except Exception as e:
+            _log.exception("Unexpected error recording new version metadata")
+            _show_later(QMessageBox.critical, parent_widget,
+                        "New Version Not Recorded", str(e))
+            return None
+
+        if error is None:
+            _show_later(
+                _show_tables,
+                parent_widget,
+                "New Version Created",
+                "New version created successfully!\n\nTable(s):",
+                output_tables
+            )
 
         return {
             'assessment_name': assessment_name,
@@ -240,7 +353,7 @@ class AssessmentExecutor:
             project_db_id=self.project_db_id,
         )
         try:
-            result = RollbackVersion(self.admin_manager).execute(cmd)
+            result = self._use_case(RollbackVersion).execute(cmd)
         except (ValueError, RuntimeError) as e:
             QMessageBox.critical(parent_widget, "Rollback Failed", str(e))
             return None
@@ -274,7 +387,7 @@ class AssessmentExecutor:
             project_db_id=self.project_db_id,
         )
         try:
-            result = CompareVersions(self.admin_manager).execute(cmd)
+            result = self._use_case(CompareVersions).execute(cmd)
         except (ValueError, RuntimeError) as e:
             QMessageBox.critical(parent_widget, "Compare Failed", str(e))
             return None
@@ -301,52 +414,58 @@ class AssessmentExecutor:
             return None
 
         try:
-            assessment_id = self.admin_manager.create_assessment(
-                project_id=self.project_db_id,
-                name=wizard_results.get('assessment_name', ''),
-                description=wizard_results.get('description', ''),
-                target_layer=wizard_results.get('target_layer', ''),
-                assessment_layers=wizard_results.get('assessment_layers', []),
-                output_tables=wizard_results.get('output_tables', [])
-            )
-
-            for table_name in wizard_results.get('output_tables', []):
-                self.admin_manager.set_layer_visibility(assessment_id, table_name, True)
+            # One admin.sqlite commit for the assessment, its visibility
+            # rows and its provenance.
+            with self.admin_manager.transaction():
+                assessment_id = self.admin_manager.create_assessment(
+                    project_id=self.project_db_id,
+                    name=wizard_results.get('assessment_name', ''),
+                    description=wizard_results.get('description', ''),
+                    target_layer=wizard_results.get('target_layer', ''),
+                    assessment_layers=wizard_results.get('assessment_layers', []),
+                    output_tables=wizard_results.get('output_tables', [])
+                )
 
-            if wizard_results.get('assessment_layers'):
-                self._record_provenance(
-                    assessment_id=assessment_id,
-                    output_tables=wizard_results.get('output_tables', []),
-                    target_layer_name=wizard_results.get('target_layer', ''),
-                    assessment_layer_names=wizard_results.get('assessment_layers', [])
+                self.admin_manager.set_layer_visibilities(
+                    assessment_id,
+                    [(t, True) for t in wizard_results.get('output_tables', [])]
                 )
 
+                if wizard_results.get('assessment_layers'):
+                    self._record_provenance(
+                        assessment_id=assessment_id,
+                        output_tables=wizard_results.get('output_tables', []),
+                        target_layer_name=wizard_results.get('target_layer', ''),
+                        assessment_layer_names=wizard_results.get('assessment_layers', [])
+                    )
+
             return assessment_id
 
-        except Exception as e:
-            print(f"Warning: Could not record assessment in metadata: {e}")
+        except sqlite3.Error as e:
+            _log.warning("Could not record assessment in metadata: %s", e)
+            return None
+        except Exception:
+            _log.exception("Unexpected error recording assessment metadata")
             return None
 
     def _record_provenance(self, assessment_id, output_tables,
                            target_layer_name, assessment_layer_names):
-        """Create provenance + task_details entries in admin.sqlite."""
+        """Create provenance + task_details entries in admin.sqlite.
+
+        Called inside the caller's transaction; errors propagate so the
+        whole record rolls back rather than committing without provenance.
+        """
         if not self.admin_manager:
             return
-        try:
-            provenance_id = self.admin_manager.create_provenance(
-                assessment_id=assessment_id,
-                name="Initial Assessment",
-                description="Base spatial analysis: union + intersection"
-            )
-            self.admin_manager.add_task(
-                provenance_id=provenance_id,
-                step_order=1,
-                operation="union+intersect",
-                category="spatial_analysis",
-                engine_type="spatialite",
-                input_tables=[target_layer_name] + assessment_layer_names,
-                output_tables=output_tables,
-                added_to_map=True
-            )
-        except Exception as e:
-            print(f"Warning: Could not record provenance: {e}")
+        self.admin_manager.create_provenance_with_task(
+            assessment_id=assessment_id,
+            name="Initial Assessment",
+            description="Base spatial analysis: union",
+            step_order=1,
+            operation="union",
+            category="spatial_analysis",
+            engine_type="spatialite",
+            input_tables=[target_layer_name] + assessment_layer_names,
+            output_tables=output_tables,
+            added_to_map=True
+        )
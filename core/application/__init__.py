@@ -30,9 +30,11 @@ from .use_cases import (
     CompareVersionsCommand,
     CreateScenario,
     ApplyOverlay,
+    make_base_names,
     RollbackVersion,
     CompareVersions,
 )
+from .overlay_task import OverlayTask
 
 __all__ = [
     'CreateScenarioCommand',
@@ -41,6 +43,8 @@ __all__ = [
     'CompareVersionsCommand',
     'CreateScenario',
     'ApplyOverlay',
+    'make_base_names',
     'RollbackVersion',
     'CompareVersions',
+    'OverlayTask',
 ]
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+OverlayTask — runs a batch of versioned overlays on a QGIS task-manager thread.
+
+The overlay SQL (union + version bookkeeping) is the slow part of a spatial
+assessment and only touches SpatiaLite, so it can leave the GUI thread.
+Everything that touches QGIS objects stays on the main thread:
+
+  - run()      → worker thread: SpatialEngine.overlay(..., load_layer=False)
+                 on a private (non-pooled) connection.
+  - finished() → main thread: load the new tables as QGIS layers, then
+                 hand the outcome to the caller's callback.
+
+Inputs are plain strings (table names, db path); no QgsVectorLayer is ever
+read from the worker thread.
+"""
+
+from qgis.core import QgsTask
+
+# Python references to queued tasks. The task manager owns the C++ object,
+# but the Python wrapper (with run/finished) must outlive the caller's scope.
+_active_tasks = set()
+
+
+class OverlayTask(QgsTask):
+    """Background task: run one overlay per plan entry on a project database.
+
+    Args:
+        description:  str — label shown in the QGIS task manager
+        db_path:      str — absolute path to the project SpatiaLite file
+        target_table: str — sanitized target table name
+        plan:         list of (assessment_table, base_name) tuples
+        group_name:   str or None — layer tree group for the result layers
+        callback:     callable(results, error), called on the main thread.
+                      results is the list of overlay result dicts
+                      ({'table', 'version_id', ...}) that completed, in plan
+                      order; error is the exception that stopped the run,
+                      or None.
+        owner_alive:  optional callable() -> bool, checked on the main
+                      thread before the results are loaded as layers.
+                      False when whoever queued the task has shut down.
+    """
+
+    def __init__(self, description, db_path, target_table, plan,
+                 group_name, callback, owner_alive=None):
+        super().__init__(description, QgsTask.CanCancel)
+        self._db_path      = db_path
+        self._target_table = target_table
+        self._plan         = list(plan)
+        self._group_name   = group_name
+        self._callback     = callback
+        self._owner_alive  = owner_alive
+        self._results      = []
+        self._error        = None
+        _active_tasks.add(self)
+
+    @staticmethod
+    def running_on(db_path):
+        """True while an OverlayTask on db_path is queued or running.
+
+        Callers queue at most one task per project database: overlays on
+        the same file would only wait on each other's write lock.
+        """
+        return any(task._db_path == db_path for task in _active_tasks)
+
+    def run(self):
+        """Worker thread: compute every overlay. Returns True on success."""
+        from ..spatial_engine import SpatialEngine
+        # Sequential on one connection; see the note in ApplyOverlay.execute.
+        try:
+            with SpatialEngine(self._db_path, shared=False) as engine:
+                for i, (assessment_table, base_name) in enumerate(self._plan):
+                    if self.isCanceled():
+                        self._error = RuntimeError("Overlay was canceled.")
+                        return False
+                    self._results.append(engine.overlay(
+                        self._target_table, assessment_table, base_name,
+                        load_layer=False,
+                    ))
+                    self.setProgress(100.0 * (i + 1) / len(self._plan))
+        except Exception as e:
+            self._error = e
+            return False
+        return True
+
+    def finished(self, result):
+        """Main thread: load completed tables as layers, then report."""
+        _active_tasks.discard(self)
+        owner_alive = self._owner_alive is None or self._owner_alive()
+        if self._results and owner_alive and not self.isCanceled():
+            # Versions that were committed before a failure are real; load
+            # them so they are not orphaned. A private connection, closed
+            # here: the pooled ones may already have been shut down.
+            from ..spatial_engine import SpatialEngine
+            try:
+                with SpatialEngine(self._db_path, shared=False) as engine:
+                    engine.load_tables(
+                        [(r['table'], base_name) for r, (_, base_name)
+                         in zip(self._results, self._plan)],
+                        group_name=self._group_name,
+                    )
+            except Exception as e:
+                self._error = self._error or e
+        self._callback(self._results, self._error)
@@ -8,7 +8,7 @@ from .commands import (
     CompareVersionsCommand,
 )
 from .create_scenario import CreateScenario
-from .apply_overlay import ApplyOverlay
+from .apply_overlay import ApplyOverlay, make_base_names
 from .rollback_version import RollbackVersion
 from .compare_versions import CompareVersions
 
@@ -19,6 +19,7 @@ __all__ = [
     'CompareVersionsCommand',
     'CreateScenario',
     'ApplyOverlay',
+    'make_base_names',
     'RollbackVersion',
     'CompareVersions',
 ]
@@ -20,8 +20,29 @@ Raises:
   - RuntimeError: project DB path not found.
 """
 
+from ...spatial_engine import SpatialEngine
 from .commands import ApplyOverlayCommand
 
+# Spaces in assessment layer names become '_' in output base names. Only
+# spaces: the engine sanitizes table names itself, and the base name is also
+# the layer name users see in QGIS.
+_BASE_NAME_TABLE = str.maketrans(' ', '_')
+
+
+def make_base_names(project_id, assessment_name, assessment_layer_names):
+    """Compute the base table name of each overlay run, in order.
+
+    A single assessment layer gets the bare "{project}__{assessment}"
+    name; several get the layer name appended to tell them apart.
+    Shared by ApplyOverlay and the re-run path, so a re-run extends the
+    same version history.
+    """
+    prefix = f"{project_id}__{assessment_name}"
+    if len(assessment_layer_names) == 1:
+        return [prefix]
+    return [f"{prefix}_{name.translate(_BASE_NAME_TABLE)}"
+            for name in assessment_layer_names]
+
 
 class ApplyOverlay:
     """Use case: run a versioned spatial overlay for one assessment.
@@ -64,37 +85,43 @@ class ApplyOverlay:
             )
 
         scenario = self._build_scenario(cmd)
-        qgs_layer_map = self._build_layer_map(cmd)
 
         output_tables = []
         version_ids   = []
 
-        from ...spatial_engine import SpatialEngine
         with SpatialEngine(project_db_path) as engine:
-            # Migrate all layers → populate table_name in domain objects
-            for layer_ref in scenario['all_layers']:
-                qgs_layer = qgs_layer_map[layer_ref['name']]
-                layer_ref['table_name'] = engine.prepare_layer(qgs_layer)
-
-            # Run versioned overlay per assessment layer
+            # Migrate all layers → populate table_name in domain objects.
+            # One commit for the whole batch instead of several per layer.
+            with engine.transaction():
+                for layer_ref in scenario['all_layers']:
+                    layer_ref['table_name'] = engine.prepare_layer(layer_ref['layer'])
+
+            # Run versioned overlay per assessment layer. Kept sequential:
+            # every overlay writes to the same SpatiaLite file, so worker
+            # threads would only queue on its single write lock, and the
+            # resulting QGIS layers must be created on the main thread.
+            target_table = scenario['target_layer']['table_name']
             for a_ref in scenario['assessment_layers']:
-                base_name = self._make_base_name(
-                    cmd.project_id, cmd.assessment_name,
-                    a_ref['name'], len(scenario['assessment_layers'])
-                )
                 result = engine.overlay(
-                    scenario['target_layer']['table_name'],
+                    target_table,
                     a_ref['table_name'],
-                    base_name,
-                    group_name=self.OUTPUT_GROUP_NAME,
+                    a_ref['base_name'],
+                    load_layer=False,
                 )
                 output_tables.append(result['table'])
                 version_ids.append(result['version_id'])
 
+            # Add every result to the map in one batch
+            engine.load_tables(
+                [(table, a_ref['base_name']) for table, a_ref
+                 in zip(output_tables, scenario['assessment_layers'])],
+                group_name=self.OUTPUT_GROUP_NAME,
+            )
+
         return {
             'assessment_name':    cmd.assessment_name,
-            'target_layer':       cmd.target_layer.name(),
-            'assessment_layers':  [al.name() for al in cmd.assessment_layers],
+            'target_layer':       scenario['target_layer']['name'],
+            'assessment_layers':  [a['name'] for a in scenario['assessment_layers']],
             'output_tables':      output_tables,
             'description':        cmd.description,
             'version_ids':        version_ids,
@@ -117,11 +144,25 @@ class ApplyOverlay:
             )
 
     def _build_scenario(self, cmd: ApplyOverlayCommand) -> dict:
-        """Build a lightweight scenario dict (avoids circular imports with domain)."""
-        target = {'name': cmd.target_layer.name(), 'table_name': ''}
+        """Build a lightweight scenario dict (avoids circular imports with domain).
+
+        Each ref carries its QgsVectorLayer and its name, read once here
+        (name() is a SIP call); assessment refs also carry their output
+        base_name, computed once rather than inside the overlay loop.
+        """
+        target = {
+            'name': cmd.target_layer.name(),
+            'layer': cmd.target_layer,
+            'table_name': '',
+        }
+        names = [al.name() for al in cmd.assessment_layers]
+        base_names = make_base_names(
+            cmd.project_id, cmd.assessment_name, names
+        )
         assessments = [
-            {'name': al.name(), 'table_name': ''}
-            for al in cmd.assessment_layers
+            {'name': name, 'layer': al, 'table_name': '', 'base_name': base_name}
+            for name, al, base_name
+            in zip(names, cmd.assessment_layers, base_names)
         ]
         all_layers = [target] + assessments
         return {
@@ -129,18 +170,3 @@ class ApplyOverlay:
             'assessment_layers': assessments,
             'all_layers':       all_layers,
         }
-
-    def _build_layer_map(self, cmd: ApplyOverlayCommand) -> dict:
-        """Map layer name → QgsVectorLayer for fast lookup during migration."""
-        layer_map = {cmd.target_layer.name(): cmd.target_layer}
-        layer_map.update({al.name(): al for al in cmd.assessment_layers})
-        return layer_map
-
-    @staticmethod
-    def _make_base_name(project_id, assessment_name, assessment_layer_name,
-                        total_count) -> str:
-        """Compute the base table name for one overlay run."""
-        if total_count == 1:
-            return f"{project_id}__{assessment_name}"
-        safe = assessment_layer_name.replace(' ', '_')
-        return f"{project_id}__{assessment_name}_{safe}"
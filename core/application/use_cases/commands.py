@@ -12,8 +12,10 @@ No validation lives in commands — validation is the use case's responsibility.
 from dataclasses import dataclass, field
 from typing import List, Optional
 
+from ...domain.compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class CreateScenarioCommand:
     """Command for the CreateScenario use case.
 
@@ -34,11 +36,11 @@ class CreateScenarioCommand:
     target_layer: object  # QgsVectorLayer — QGIS stays at this boundary
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ApplyOverlayCommand:
     """Command for the ApplyOverlay use case.
 
-    Runs a versioned spatial overlay (intersection + union) on target vs.
+    Runs a versioned spatial overlay (union) on target vs.
     one or more assessment layers, storing results in SpatiaLite.
 
     Attributes:
@@ -57,7 +59,7 @@ class ApplyOverlayCommand:
     assessment_layers: List     # list[QgsVectorLayer]
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RollbackVersionCommand:
     """Command for the RollbackVersion use case.
 
@@ -76,7 +78,7 @@ class RollbackVersionCommand:
     group_name: str = "Output Layers"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CompareVersionsCommand:
     """Command for the CompareVersions use case.
 
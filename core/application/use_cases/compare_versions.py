@@ -20,6 +20,7 @@ Raises:
   - ValueError:   version_id_a or version_id_b not found.
 """
 
+from ...spatial_engine import SpatialEngine
 from .commands import CompareVersionsCommand
 
 
@@ -59,16 +60,12 @@ class CompareVersions:
                 f"Project database path not found for project_db_id={cmd.project_db_id}."
             )
 
-        from ...spatial_engine import SpatialEngine
         with SpatialEngine(project_db_path) as engine:
-            layer_a = engine.load_version(
-                cmd.version_id_a,
-                display_name=f"{cmd.scenario_name} [v{cmd.version_id_a}]",
-                group_name=cmd.group_name,
-            )
-            layer_b = engine.load_version(
-                cmd.version_id_b,
-                display_name=f"{cmd.scenario_name} [v{cmd.version_id_b}]",
+            layer_a, layer_b = engine.load_versions(
+                [
+                    (cmd.version_id_a, f"{cmd.scenario_name} [v{cmd.version_id_a}]"),
+                    (cmd.version_id_b, f"{cmd.scenario_name} [v{cmd.version_id_b}]"),
+                ],
                 group_name=cmd.group_name,
             )
 
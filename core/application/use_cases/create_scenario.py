@@ -14,7 +14,7 @@ Raises:
   - ValueError: if name is a duplicate or no features are selected.
 """
 
-from qgis.core import QgsProject, QgsVectorLayer, QgsWkbTypes
+from qgis.core import QgsFeatureRequest, QgsProject
 
 from .commands import CreateScenarioCommand
 
@@ -80,30 +80,25 @@ class CreateScenario:
                 )
 
     def _validate_selection(self, target_layer):
-        selected = list(target_layer.selectedFeatures())
-        if not selected:
+        # Count only: no features (or geometries) are fetched to validate
+        if target_layer.selectedFeatureCount() == 0:
             raise ValueError(
                 "No features are selected in the target layer. "
                 "Please select features before creating the assessment."
             )
 
     def _build_memory_layer(self, target_layer, layer_name):
-        selected = list(target_layer.selectedFeatures())
-        geom_type = QgsWkbTypes.displayString(target_layer.wkbType())
-        crs = target_layer.crs().authid()
-
-        memory_layer = QgsVectorLayer(
-            f"{geom_type}?crs={crs}", layer_name, "memory"
-        )
-        dp = memory_layer.dataProvider()
-        dp.addAttributes(target_layer.fields().toList())
-        memory_layer.updateFields()
-        dp.addFeatures(selected)
-        memory_layer.updateExtents()
+        # materialize() copies fields, CRS and the selected features into a
+        # memory layer entirely in C++, with no per-feature Python objects.
+        request = QgsFeatureRequest().setFilterFids(target_layer.selectedFeatureIds())
+        memory_layer = target_layer.materialize(request)
+        memory_layer.setName(layer_name)
         return memory_layer
 
     def _add_to_qgis(self, layer, group_name):
-        root = QgsProject.instance().layerTreeRoot()
+        project = QgsProject.instance()
+        root = project.layerTreeRoot()
         group = root.findGroup(group_name) or root.addGroup(group_name)
-        QgsProject.instance().addMapLayer(layer, False)
+        # Same batch call the spatial engine uses for its result layers
+        project.addMapLayers([layer], False)
         group.addLayer(layer)
@@ -14,6 +14,7 @@ Raises:
   - ValueError:   version_id not found (propagated from SpatialEngine).
 """
 
+from ...spatial_engine import SpatialEngine
 from .commands import RollbackVersionCommand
 
 
@@ -50,7 +51,6 @@ class RollbackVersion:
                 f"Project database path not found for project_db_id={cmd.project_db_id}."
             )
 
-        from ...spatial_engine import SpatialEngine
         with SpatialEngine(project_db_path) as engine:
             result = engine.rollback_to_version(
                 cmd.scenario_name,
@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+"""
+Python-version shims shared by the domain models and the use-case commands.
+"""
+
+import sys
+
+# Keyword arguments for @dataclass: instances get __slots__ instead of a
+# per-instance __dict__. slots=True needs Python 3.10; QGIS 3.x builds that
+# ship an older Python fall back to plain dataclasses.
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
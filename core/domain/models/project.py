@@ -5,11 +5,29 @@ Project — domain entity representing an assessment project.
 Holds metadata only. No QGIS dependency. No database access.
 """
 
+import json
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List, Optional
 
+from ..compat import DATACLASS_SLOTS
 
-@dataclass
+
+@lru_cache(maxsize=256)
+def _parse_layer_names(raw: str) -> tuple:
+    """Decode a base_layer_names JSON array; invalid JSON -> ().
+
+    Cached on the raw string: the same project row is hydrated on every
+    tree refresh. Returns a tuple so cached values cannot be mutated.
+    """
+    try:
+        names = json.loads(raw)
+    except (ValueError, TypeError):
+        return ()
+    return tuple(names) if isinstance(names, list) else ()
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Project:
     """Domain entity: a named project with one SpatiaLite database.
 
@@ -57,13 +75,9 @@ class Project:
     @classmethod
     def from_dict(cls, data: dict) -> 'Project':
         """Build a Project from an AdminManager row dict."""
-        import json
         raw_layers = data.get('base_layer_names', '')
-        if raw_layers:
-            try:
-                layer_names = json.loads(raw_layers)
-            except (ValueError, TypeError):
-                layer_names = []
+        if raw_layers and isinstance(raw_layers, str):
+            layer_names = list(_parse_layer_names(raw_layers))
         else:
             layer_names = []
 
@@ -15,10 +15,14 @@ Terminology mapping:
 from dataclasses import dataclass, field
 from typing import List, Optional
 
+from ..compat import DATACLASS_SLOTS
 from .layer_role import LayerRole
 
+# "LayerRef(<role>: " per role, built once for LayerRef.__str__
+_REF_PREFIX = {role: f"LayerRef({role.value}: " for role in LayerRole}
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class LayerRef:
     """Value object: an immutable reference to a named spatial layer.
 
@@ -40,11 +44,11 @@ class LayerRef:
         return bool(self.table_name)
 
     def __str__(self) -> str:
-        status = self.table_name if self.is_migrated else '<not migrated>'
-        return f"LayerRef({self.role.value}: {self.name!r} → {status})"
+        status = self.table_name or '<not migrated>'
+        return f"{_REF_PREFIX[self.role]}{self.name!r} → {status})"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Scenario:
     """Aggregate root for one analysis run inside a project.
 
@@ -74,6 +78,13 @@ class Scenario:
     id: Optional[int] = None
     is_deleted: bool = False
 
+    # Shadow of output_tables for O(1) duplicate checks in add_output_table
+    _output_seen: set = field(default_factory=set, init=False, repr=False,
+                              compare=False)
+
+    def __post_init__(self):
+        self._output_seen.update(self.output_tables)
+
     # ------------------------------------------------------------------ #
     #  Computed properties
     # ------------------------------------------------------------------ #
@@ -120,8 +131,13 @@ class Scenario:
                 lr.table_name = table_name
 
     def add_output_table(self, table_name: str) -> None:
-        """Append a result table name after a successful overlay operation."""
-        if table_name not in self.output_tables:
+        """Append a result table name after a successful overlay operation.
+
+        Output tables should only be added through here, so the duplicate
+        check stays in step with output_tables.
+        """
+        if table_name not in self._output_seen:
+            self._output_seen.add(table_name)
             self.output_tables.append(table_name)
 
     # ------------------------------------------------------------------ #
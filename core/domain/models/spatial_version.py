@@ -11,8 +11,10 @@ No QGIS dependency. No database access.
 from dataclasses import dataclass
 from typing import Optional
 
+from ..compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class SpatialVersion:
     """An immutable snapshot of a spatial analysis result.
 
@@ -5,9 +5,15 @@ Spatial Engine package — facade for all SpatiaLite spatial operations.
 Public API:
     SpatialEngine     — main entry point (context manager)
     OverlayOperation  — enum for operation types
+    close_shared_connections — close the pooled SpatiaLite connections
+    sanitize_table_name      — table name for a layer name, no connection
 """
 
 from .engine import SpatialEngine
 from .operations import OverlayOperation
+from .repository import close_shared_connections, sanitize_table_name
 
-__all__ = ["SpatialEngine", "OverlayOperation"]
+__all__ = [
+    "SpatialEngine", "OverlayOperation", "close_shared_connections",
+    "sanitize_table_name",
+]
@@ -55,12 +55,15 @@ class SpatialEngine:
             engine.close()
     """
 
-    def __init__(self, db_path):
+    def __init__(self, db_path, shared=True):
         """
         Args:
             db_path: str — absolute path to the project's SpatiaLite .sqlite file
+            shared:  bool — reuse the pooled connection (main thread). Pass
+                     False to get a private connection, e.g. in a QgsTask.
         """
         self._db_path = db_path
+        self._shared = shared
         self._repo = None
         self._ops = None
 
@@ -70,12 +73,12 @@ class SpatialEngine:
 
     def open(self):
         """Open the SpatiaLite connection and initialise internal components."""
-        self._repo = SpatialRepository(self._db_path)
+        self._repo = SpatialRepository(self._db_path, shared=self._shared)
         self._repo.open()
         self._ops = OperationRunner(self._repo)
 
     def close(self):
-        """Close the SpatiaLite connection."""
+        """Release the SpatiaLite connection (pooled; see repository)."""
         if self._repo:
             self._repo.close()
             self._repo = None
@@ -89,6 +92,14 @@ class SpatialEngine:
         self.close()
         return False  # never suppress exceptions
 
+    def transaction(self):
+        """Context manager: group several engine calls into one commit.
+
+        Rolls everything back if the block raises. Nested blocks join the
+        outermost one.
+        """
+        return self._repo.transaction()
+
     # ------------------------------------------------------------------ #
     #  Layer preparation
     # ------------------------------------------------------------------ #
@@ -106,12 +117,20 @@ class SpatialEngine:
         """
         return self._repo.ensure_layer(qgs_layer)
 
+    def sanitize_name(self, raw_name):
+        """Return the SpatiaLite table name prepare_layer() uses for raw_name.
+
+        Lets callers resolve the tables of already-migrated layers without a
+        QgsVectorLayer in hand.
+        """
+        return self._repo.sanitize_name(raw_name)
+
     # ------------------------------------------------------------------ #
     #  Overlay analysis (Phase 3 — versioned)
     # ------------------------------------------------------------------ #
 
     def overlay(self, target_table, assessment_table, output_name,
-                group_name=None):
+                group_name=None, load_layer=True):
         """Run the full overlay pipeline and create an immutable versioned table.
 
         Each call creates a NEW table `{output_name}__v{n}` — previous versions
@@ -120,12 +139,15 @@ class SpatialEngine:
         Steps:
           1. Count existing versions → determine n
           2. Compute versioned table name: {sanitized_output_name}__v{n}
-          3. Run intersection → tmp_intersect (SpatiaLite only, no QGIS)
-          4. Run union        → tmp_union     (SpatiaLite only, no QGIS)
-          5. Rename tmp_union → final versioned table
-          6. Drop tmp_intersect
-          7. Record version in spatial_versions (HEAD = new version)
-          8. Load final table as a QGIS layer
+          3. Run union        → tmp_union     (SpatiaLite only, no QGIS)
+          4. Rename tmp_union → final versioned table
+          5. Record version in spatial_versions (HEAD = new version)
+          6. Load final table as a QGIS layer
+
+        The intersection is not computed: only the union is kept as the
+        version table. Steps 1-5 run in a single transaction; the layer is
+        loaded after it commits so the QGIS provider's own connection can
+        see the table.
 
         Args:
             target_table:     str — sanitized source table name in SpatiaLite
@@ -133,6 +155,8 @@ class SpatialEngine:
             output_name:      str — base name (e.g. "project__assessment")
                                     Version suffix is appended automatically.
             group_name:       str or None — QGIS layer tree group for the result
+            load_layer:       bool — if False, skip step 6 ('layer' is None);
+                                     batch several results with load_tables()
 
         Returns:
             dict: {
@@ -143,44 +167,40 @@ class SpatialEngine:
         """
         base_sanitized = self._repo.sanitize_name(output_name)
 
-        # Determine version number from existing history
-        existing_versions = self._repo.get_versions(base_sanitized)
-        version_num = len(existing_versions) + 1
-        versioned_name = f"{base_sanitized}__v{version_num}"
-
-        tmp_intersect = f"{versioned_name}_tmp_intersect"
-        tmp_union     = f"{versioned_name}_tmp_union"
-        final_table   = versioned_name  # already sanitized via base_sanitized
-
-        # Step 1 — Intersection (intermediate only)
-        self._ops.execute(
-            target_table, assessment_table, tmp_intersect,
-            operation=OverlayOperation.INTERSECT
-        )
-
-        # Step 2 — Union (intermediate only)
-        self._ops.execute(
-            target_table, assessment_table, tmp_union,
-            operation=OverlayOperation.UNION
-        )
-
-        # Step 3 — Promote union as the final versioned table
-        self._repo.rename_table(tmp_union, final_table)
-
-        # Step 4 — Remove intermediate intersection
-        self._repo.drop_table(tmp_intersect)
-
-        # Step 5 — Record in spatial_versions (new HEAD)
-        parent_id = existing_versions[0]['id'] if existing_versions else None
-        version_id = self._repo.create_version(
-            scenario_name=base_sanitized,
-            table_name=final_table,
-            description=f"Version {version_num}",
-            parent_version_id=parent_id,
-        )
-
-        # Step 6 — Load as QGIS layer (display name = base name, no version suffix)
-        layer = self._ops.create_qgis_layer(final_table, output_name, group_name)
+        with self._repo.transaction():
+            # Determine version number from existing history. Read under the
+            # write lock, so a concurrent overlay cannot claim the same n.
+            existing_versions = self._repo.get_versions(base_sanitized)
+            version_num = len(existing_versions) + 1
+            versioned_name = f"{base_sanitized}__v{version_num}"
+
+            tmp_union     = f"{versioned_name}_tmp_union"
+            # already sanitized via base_sanitized
+            final_table   = versioned_name
+
+            # Step 1 — Union (intermediate only)
+            self._ops.execute(
+                target_table, assessment_table, tmp_union,
+                operation=OverlayOperation.UNION
+            )
+
+            # Step 2 — Promote union as the final versioned table
+            self._repo.rename_table(tmp_union, final_table)
+
+            # Step 3 — Record in spatial_versions (new HEAD)
+            parent_id = (existing_versions[0]['id']
+                         if existing_versions else None)
+            version_id = self._repo.create_version(
+                scenario_name=base_sanitized,
+                table_name=final_table,
+                description=f"Version {version_num}",
+                parent_version_id=parent_id,
+            )
+
+        # Step 4 — Load as QGIS layer (display name = base name, no version suffix)
+        layer = None
+        if load_layer:
+            layer = self._ops.create_qgis_layer(final_table, output_name, group_name)
 
         return {
             'table': final_table,
@@ -188,6 +208,21 @@ class SpatialEngine:
             'layer': layer,
         }
 
+    def load_tables(self, tables, group_name=None):
+        """Load several SpatiaLite tables as QGIS layers in one batch.
+
+        Used after a series of overlay(..., load_layer=False) calls so the
+        map and layer tree update once for all results.
+
+        Args:
+            tables:     list of (table_name, display_name) tuples
+            group_name: str or None — QGIS layer tree group
+
+        Returns:
+            list[QgsVectorLayer], in the same order as tables
+        """
+        return self._ops.create_qgis_layers(tables, group_name)
+
     # ------------------------------------------------------------------ #
     #  Version history (Phase 3)
     # ------------------------------------------------------------------ #
@@ -247,6 +282,30 @@ class SpatialEngine:
             raise ValueError(f"Version {version_id} not found in spatial_versions.")
         return self._ops.create_qgis_layer(version['table_name'], display_name, group_name)
 
+    def load_versions(self, versions, group_name=None):
+        """Load several existing versions as QGIS layers in one batch.
+
+        Every version is resolved before any layer is created, so a missing
+        id leaves the map untouched.
+
+        Args:
+            versions:   list of (version_id, display_name) tuples
+            group_name: str or None — QGIS layer tree group
+
+        Returns:
+            list[QgsVectorLayer], in the same order as versions
+
+        Raises:
+            ValueError: if any version_id is not found in spatial_versions.
+        """
+        tables = []
+        for version_id, display_name in versions:
+            version = self._repo.get_version_by_id(version_id)
+            if version is None:
+                raise ValueError(f"Version {version_id} not found in spatial_versions.")
+            tables.append((version['table_name'], display_name))
+        return self.load_tables(tables, group_name)
+
     def rollback_to_version(self, scenario_name, version_id, group_name=None):
         """Restore HEAD to a previous version — O(1), no spatial recalculation.
 
@@ -41,8 +41,8 @@ class OperationRunner:
             output_table: str — name for the result table
             operation: OverlayOperation
 
-        Returns:
-            int: number of rows written to output_table
+        Rows are not counted: no caller reads the count, and COUNT(*)
+        would be a full scan of the new table.
         """
         from ...spatial_analysis_spatialite import SpatialAnalyzerLite, OperationType
 
@@ -52,12 +52,12 @@ class OperationRunner:
             OverlayOperation.BOTH:      OperationType.BOTH,
         }
         analyzer = SpatialAnalyzerLite(self._repo.project_manager)
-        result = analyzer.analyze_and_create_layer(
+        analyzer.analyze_and_create_layer(
             target_table, assessment_table, output_table,
             operation_type=op_map[operation],
-            add_to_qgis=False
+            add_to_qgis=False,
+            count_features=False,
         )
-        return result.get('total_count', 0)
 
     def create_qgis_layer(self, table_name, layer_name, group_name=None):
         """Load a SpatiaLite table as a QGIS vector layer and add it to the map.
@@ -73,3 +73,17 @@ class OperationRunner:
         from ...spatial_analysis_spatialite import SpatialAnalyzerLite
         analyzer = SpatialAnalyzerLite(self._repo.project_manager)
         return analyzer._create_qgis_layer(table_name, layer_name, group_name)
+
+    def create_qgis_layers(self, tables, group_name=None):
+        """Load several SpatiaLite tables as QGIS layers in one batch.
+
+        Args:
+            tables:     list of (table_name, layer_name) tuples
+            group_name: str or None — layer tree group
+
+        Returns:
+            list[QgsVectorLayer], in the same order as tables
+        """
+        from ...spatial_analysis_spatialite import SpatialAnalyzerLite
+        analyzer = SpatialAnalyzerLite(self._repo.project_manager)
+        return analyzer._create_qgis_layers(tables, group_name)
@@ -6,6 +6,33 @@ Encapsulates the connection lifecycle, table inspection, and layer migration.
 Higher layers (engine, use-cases) never import ProjectManager directly.
 """
 
+# db_path -> connected ProjectManager. Repositories on the same database
+# share one connection for the whole session, so SpatiaLite is loaded and
+# the page cache warmed once instead of on every engine call.
+_shared_managers = {}
+
+
+def close_shared_connections(db_path=None):
+    """Disconnect the shared SpatiaLite connection for db_path, or all of
+    them when db_path is None (call on plugin close)."""
+    if db_path is not None:
+        pm = _shared_managers.pop(db_path, None)
+        if pm is not None:
+            pm.disconnect()
+        return
+    while _shared_managers:
+        _, pm = _shared_managers.popitem()
+        pm.disconnect()
+
+
+def sanitize_table_name(raw_name):
+    """Return the SpatiaLite table name ensure_layer() uses for raw_name.
+
+    Pure string work; needs no open connection.
+    """
+    from ...project_manager import _sanitize_table_name
+    return _sanitize_table_name(raw_name)
+
 
 class SpatialRepository:
     """Thin wrapper around ProjectManager that hides SpatiaLite details.
@@ -16,8 +43,16 @@ class SpatialRepository:
             repo.rename_table(old, new)
     """
 
-    def __init__(self, db_path):
+    def __init__(self, db_path, shared=True):
+        """
+        Args:
+            db_path: str — absolute path to the project's SpatiaLite file
+            shared:  bool — use the session-wide pooled connection. Pass
+                     False from worker threads: sqlite3 connections are
+                     bound to the thread that opened them.
+        """
         self.db_path = db_path
+        self.shared = shared
         self._pm = None
 
     # ------------------------------------------------------------------ #
@@ -25,16 +60,25 @@ class SpatialRepository:
     # ------------------------------------------------------------------ #
 
     def open(self):
-        """Open the SpatiaLite connection."""
-        from ...project_manager import ProjectManager
-        self._pm = ProjectManager(self.db_path)
-        self._pm.connect()
+        """Attach to the shared SpatiaLite connection, opening it if needed."""
+        pm = _shared_managers.get(self.db_path) if self.shared else None
+        if pm is None or pm.connection is None:
+            from ...project_manager import ProjectManager
+            pm = ProjectManager(self.db_path)
+            pm.connect()
+            if self.shared:
+                _shared_managers[self.db_path] = pm
+        self._pm = pm
 
     def close(self):
-        """Close the SpatiaLite connection."""
-        if self._pm:
+        """Detach from the shared connection (it stays open for reuse).
+
+        close_shared_connections() closes it for good. A non-shared
+        connection is closed here.
+        """
+        if self._pm and not self.shared:
             self._pm.disconnect()
-            self._pm = None
+        self._pm = None
 
     def __enter__(self):
         self.open()
@@ -44,6 +88,10 @@ class SpatialRepository:
         self.close()
         return False  # never suppress exceptions
 
+    def transaction(self):
+        """Context manager: run the enclosed operations as one commit."""
+        return self._pm.transaction()
+
     # ------------------------------------------------------------------ #
     #  Layer migration
     # ------------------------------------------------------------------ #
@@ -241,7 +241,7 @@ class EMDSTreeModel:
             should_expand = project['id'] in expanded_project_ids
 
             # Base Layers group (read from project SpatiaLite DB)
-            base_layers = EMDSTreeModel._get_base_layers(project, plugin_dir)
+            base_layers = EMDSTreeModel._get_base_layers(project, admin_manager)
             if base_layers:
                 bl_group = QTreeWidgetItem(proj_item)
                 bl_group.setText(0, "Base Layers")
@@ -349,11 +349,16 @@ class EMDSTreeModel:
                 )
 
     @staticmethod
-    def _get_base_layers(project, plugin_dir):
+    def _get_base_layers(project, admin_manager):
         """Read base layer names from project SpatiaLite (plain sqlite3, no extension)."""
         try:
-            db_path = os.path.join(plugin_dir, project['db_path'])
-            if not os.path.exists(db_path):
+            # Waits for a background init still running on this DB
+            db_path = admin_manager.get_project_db_path(project['id'])
+        except Exception as e:
+            print(f"Warning: Could not open project DB for '{project['name']}': {e}")
+            return []
+        try:
+            if not db_path or not os.path.exists(db_path):
                 return []
             conn = sqlite3.connect(db_path)
             cursor = conn.cursor()
@@ -386,6 +391,10 @@ class AssessmentMainForm(QDialog):
             "task_id": None
         }
 
+        # Projects with a background re-run in flight; their "New Version"
+        # action stays disabled until it finishes.
+        self._rerun_project_ids = set()
+
         # Initialize admin manager
         self.admin_manager = AdminManager(plugin_dir)
         self.admin_manager.connect()
@@ -669,9 +678,12 @@ class AssessmentMainForm(QDialog):
         assessment_id = item.data(0, ROLE_ID)
         output_tables = item.data(0, ROLE_OUTPUT_TABLES) or []
 
+        self.admin_manager.set_layer_visibilities(
+            assessment_id, [(t, checked) for t in output_tables]
+        )
+
         root = QgsProject.instance().layerTreeRoot()
         for table_name in output_tables:
-            self.admin_manager.set_layer_visibility(assessment_id, table_name, checked)
             layers = QgsProject.instance().mapLayersByName(table_name)
             for layer in layers:
                 node = root.findLayer(layer.id())
@@ -700,6 +712,8 @@ class AssessmentMainForm(QDialog):
                 act.triggered.connect(lambda: self._on_delete_project(item))
             elif node_type == 'assessment':
                 act = menu.addAction("New Version")
+                act.setEnabled(self.selected_path.get('project_id')
+                               not in self._rerun_project_ids)
                 act.triggered.connect(lambda: self._on_new_version(item))
                 menu.addSeparator()
                 act = menu.addAction("Delete Assessment")
@@ -725,7 +739,9 @@ class AssessmentMainForm(QDialog):
         name, ok = QInputDialog.getText(self, "New Project", "Project Name:")
         if ok and name.strip():
             try:
-                self.admin_manager.create_project(name.strip())
+                project_id = self.admin_manager.create_project(name.strip())
+                # Surfaces a failed SpatiaLite init of the new project DB
+                self.admin_manager.get_project_db_path(project_id)
                 self._populate_tree()
             except Exception as e:
                 QMessageBox.warning(self, "Error", f"Could not create project:\n{str(e)}")
@@ -808,8 +824,19 @@ class AssessmentMainForm(QDialog):
         project_name = self._get_project_name(project_id)
         from .assessment_executor import AssessmentExecutor
         executor = AssessmentExecutor(project_name, self.admin_manager, project_id)
-        result = executor.rerun_spatial_assessment(assessment_id, parent_widget=self)
+        # Runs in the background; the tree is refreshed once it is recorded
+        task = executor.rerun_spatial_assessment(
+            assessment_id, parent_widget=self,
+            on_finished=lambda result: self._on_new_version_finished(
+                project_id, result),
+        )
+        if task is not None:
+            self._rerun_project_ids.add(project_id)
 
+    def _on_new_version_finished(self, project_id, result):
+        """Re-enable "New Version" for the project and, if the re-run was
+        recorded, refresh the tree."""
+        self._rerun_project_ids.discard(project_id)
         if result:
             self._populate_tree()
 
@@ -868,6 +895,8 @@ class AssessmentMainForm(QDialog):
         super().showEvent(event)
 
     def closeEvent(self, event):
-        """Clean up admin manager on close."""
+        """Clean up admin manager and pooled SpatiaLite connections on close."""
+        from .core.spatial_engine import close_shared_connections
+        close_shared_connections()
         self.admin_manager.disconnect()
         super().closeEvent(event)
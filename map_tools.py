@@ -41,34 +41,16 @@ class FeatureSelectionTool(QgsMapTool):
         Returns:
             QgsVectorLayer - New memory layer with selected features
         """
-        # Get layer properties
-        crs = source_layer.crs().authid()
-        layer_name = f"{source_layer.name()}_selection"
-
-        # Create new memory layer with proper URI format
-        new_layer = QgsVectorLayer(
-            f"{QgsWkbTypes.displayString(source_layer.wkbType())}?crs={crs}",
-            layer_name, "memory"
-        )
+        # materialize() builds the memory layer from the source's geometry
+        # type, CRS and fields and copies the requested features, all in
+        # C++: no URI string to assemble, no Python feature list.
+        request = QgsFeatureRequest().setFilterFids(list(feature_ids))
+        new_layer = source_layer.materialize(request)
 
-        if not new_layer.isValid():
+        if new_layer is None or not new_layer.isValid():
             return None
 
-        # Copy fields from source layer
-        new_layer.dataProvider().addAttributes(source_layer.fields())
-        new_layer.updateFields()
-
-        # Copy features from source layer
-        features = []
-        for fid in feature_ids:
-            feature = source_layer.getFeature(fid)
-            if feature.isValid():
-                features.append(feature)
-
-        if features:
-            new_layer.dataProvider().addFeatures(features)
-            new_layer.updateExtents()
-
+        new_layer.setName(f"{source_layer.name()}_selection")
         return new_layer
 
     def canvasReleaseEvent(self, event):
@@ -8,11 +8,50 @@ Replaces database_manager.py (PostgreSQL/PostGIS) with SQLite/SpatiaLite.
 import sqlite3
 import re
 import os
+from contextlib import contextmanager
+from functools import lru_cache
 
 from qgis.core import QgsWkbTypes
 from PyQt5.QtCore import QVariant
 
 
+# Same tuning as admin.sqlite (see admin_manager), with a larger page cache
+# since overlay queries scan whole geometry tables.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -65536",        # ~64 MB page cache
+    "PRAGMA mmap_size = 268435456",      # 256 MB memory-mapped I/O
+    "PRAGMA wal_autocheckpoint = 1000",
+    "PRAGMA foreign_keys = ON",
+)
+
+# Seconds a connection waits for another one's write lock before failing
+# with "database is locked". An OverlayTask holds the lock for a whole
+# overlay, which can take minutes on large layers; sqlite3's default is 5.
+_BUSY_TIMEOUT_S = 600
+
+# Features per executemany() call in migrate_layer().
+_MIGRATE_BATCH_SIZE = 10000
+
+_NON_IDENTIFIER_RE = re.compile(r'[^a-zA-Z0-9_]')
+_UNDERSCORE_RUN_RE = re.compile(r'_{3,}')
+
+
+@lru_cache(maxsize=1024)
+def _sanitize_table_name(layer_name):
+    """Memoized body of ProjectManager.sanitize_table_name()."""
+    table_name = _NON_IDENTIFIER_RE.sub('_', layer_name)
+    table_name = table_name.lower()
+    # Remove 3+ consecutive underscores (preserves __ as separator)
+    table_name = _UNDERSCORE_RUN_RE.sub('__', table_name)
+    table_name = table_name.strip('_')
+    if table_name and table_name[0].isdigit():
+        table_name = 'layer_' + table_name
+    return table_name if table_name else 'unnamed_layer'
+
+
 class ProjectManager:
     """Manages a per-project SpatiaLite database for spatial data."""
 
@@ -25,6 +64,7 @@ class ProjectManager:
         """
         self.db_path = db_path
         self.connection = None
+        self._tx_depth = 0
 
     # ------------------------------------------------------------------ #
     #  Connection
@@ -36,8 +76,9 @@ class ProjectManager:
 
         is_new_db = not os.path.exists(self.db_path)
 
-        self.connection = sqlite3.connect(self.db_path)
-        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection = sqlite3.connect(self.db_path, timeout=_BUSY_TIMEOUT_S)
+        for pragma in _CONNECTION_PRAGMAS:
+            self.connection.execute(pragma)
 
         # Load SpatiaLite extension
         self.connection.enable_load_extension(True)
@@ -46,7 +87,7 @@ class ProjectManager:
         # Initialize spatial metadata for new databases
         if is_new_db:
             self.connection.execute("SELECT InitSpatialMetaData(1)")
-            self.connection.commit()
+            self.commit()
 
         self._create_tables()
         self.cleanup_temp_tables()
@@ -57,6 +98,46 @@ class ProjectManager:
             self.connection.close()
             self.connection = None
 
+    def commit(self):
+        """Commit pending writes, unless a transaction() block is open.
+
+        Inside transaction() the block commits once at the end, so the
+        per-step commits of migrate_layer(), rename_table(), etc. become
+        no-ops instead of one fsync each.
+        """
+        if self._tx_depth == 0:
+            self.connection.commit()
+
+    @contextmanager
+    def transaction(self):
+        """Group several operations into a single commit.
+
+        Nested calls join the outermost block, which commits on success
+        and rolls back on error:
+
+            with pm.transaction():
+                pm.migrate_layer(layer, table)
+                pm.rename_table(table, new_name)
+        """
+        self._tx_depth += 1
+        try:
+            if self._tx_depth > 1:
+                yield self.connection
+                return
+            if self.connection.in_transaction:
+                self.connection.commit()
+            # IMMEDIATE takes the write lock up front, so the block cannot
+            # fail half-way on lock upgrade.
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.connection
+            except BaseException:
+                self.connection.rollback()
+                raise
+            self.connection.commit()
+        finally:
+            self._tx_depth -= 1
+
     def _create_tables(self):
         """Create registry tables if they do not exist."""
         cursor = self.connection.cursor()
@@ -100,7 +181,7 @@ class ProjectManager:
             )
         """)
 
-        self.connection.commit()
+        self.commit()
         cursor.close()
 
     # ------------------------------------------------------------------ #
@@ -117,7 +198,7 @@ class ProjectManager:
                VALUES (?, ?, ?, ?, ?)""",
             (layer_name, geometry_type, srid, source, feature_count)
         )
-        self.connection.commit()
+        self.commit()
         cursor.close()
 
     def get_registered_layers(self):
@@ -156,7 +237,7 @@ class ProjectManager:
             "DELETE FROM base_layers_registry WHERE layer_name = ?",
             (layer_name,)
         )
-        self.connection.commit()
+        self.commit()
         cursor.close()
 
     # ------------------------------------------------------------------ #
@@ -195,7 +276,7 @@ class ProjectManager:
         except Exception:
             pass
         cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
-        self.connection.commit()
+        self.commit()
         cursor.close()
 
     def get_table_srid(self, table_name):
@@ -271,13 +352,13 @@ class ProjectManager:
 
             create_sql = f"CREATE TABLE {table_name} ({', '.join(columns)})"
             cursor.execute(create_sql)
-            self.connection.commit()
+            self.commit()
 
             # Add geometry column via SpatiaLite
             cursor.execute(
                 f"SELECT AddGeometryColumn('{table_name}', 'geom', {srid}, '{geom_type_clean}', '{dimension}')"
             )
-            self.connection.commit()
+            self.commit()
 
             # Insert features
             total_features = layer.featureCount()
@@ -285,9 +366,12 @@ class ProjectManager:
             placeholders = ', '.join(['?'] * len(field_names))
             insert_sql = (
                 f"INSERT INTO {table_name} ({quoted_fields}, geom) "
-                f"VALUES ({placeholders}, GeomFromText(?, ?))"
+                f"VALUES ({placeholders}, GeomFromWKB(?, ?))"
             )
 
+            # Rows are collected as (params, feature index, geometry) and
+            # written in batches; the geometry is kept for the 2D fallback.
+            batch = []
             for idx, feature in enumerate(layer.getFeatures()):
                 try:
                     if progress_callback:
@@ -301,37 +385,31 @@ class ProjectManager:
                         stats['errors'] += 1
                         continue
 
-                    geom_wkt = geometry.asWkt()
                     attributes = feature.attributes()
                     python_attrs = [self._convert_qvariant(attr) for attr in attributes]
-
-                    try:
-                        cursor.execute(insert_sql, python_attrs + [geom_wkt, srid])
-                        stats['inserted'] += 1
-                    except Exception:
-                        # Fallback: drop Z values and retry (handles 3D geometries)
-                        try:
-                            geom_2d = feature.geometry()
-                            geom_2d.get().dropZValue()
-                            geom_wkt_2d = geom_2d.asWkt()
-                            cursor.execute(insert_sql, python_attrs + [geom_wkt_2d, srid])
-                            stats['inserted'] += 1
-                        except Exception as e2:
-                            print(f"Error inserting feature {idx} (2D fallback failed): {e2}")
-                            stats['errors'] += 1
+                    batch.append(
+                        (python_attrs + [bytes(geometry.asWkb()), srid], idx, geometry)
+                    )
 
                 except Exception as e:
                     print(f"Error processing feature {idx}: {e}")
                     stats['errors'] += 1
 
-            self.connection.commit()
+                if len(batch) >= _MIGRATE_BATCH_SIZE:
+                    self._insert_feature_batch(cursor, insert_sql, batch, stats)
+                    batch = []
+
+            if batch:
+                self._insert_feature_batch(cursor, insert_sql, batch, stats)
+
+            self.commit()
 
             # Create spatial index
             try:
                 cursor.execute(
                     f"SELECT CreateSpatialIndex('{table_name}', 'geom')"
                 )
-                self.connection.commit()
+                self.commit()
             except Exception as e:
                 print(f"Note: Could not create spatial index for {table_name}: {e}")
 
@@ -351,6 +429,34 @@ class ProjectManager:
 
         return stats
 
+    def _insert_feature_batch(self, cursor, insert_sql, batch, stats):
+        """Insert one batch of migrate_layer() rows with a single executemany().
+
+        If any row is rejected, the batch is rolled back to its savepoint
+        and retried row by row, so only the bad rows are skipped.
+        """
+        cursor.execute("SAVEPOINT migrate_batch")
+        try:
+            cursor.executemany(insert_sql, [params for params, _, _ in batch])
+            stats['inserted'] += len(batch)
+        except sqlite3.Error:
+            cursor.execute("ROLLBACK TO migrate_batch")
+            for params, idx, geometry in batch:
+                try:
+                    cursor.execute(insert_sql, params)
+                    stats['inserted'] += 1
+                except Exception:
+                    # Fallback: drop Z values and retry (handles 3D geometries)
+                    try:
+                        geometry.get().dropZValue()
+                        params[-2] = bytes(geometry.asWkb())
+                        cursor.execute(insert_sql, params)
+                        stats['inserted'] += 1
+                    except Exception as e2:
+                        print(f"Error inserting feature {idx} (2D fallback failed): {e2}")
+                        stats['errors'] += 1
+        cursor.execute("RELEASE migrate_batch")
+
     def migrate_layers(self, layers_dict, progress_callback=None):
         """
         Migrate multiple QGIS layers to SpatiaLite.
@@ -400,7 +506,7 @@ class ProjectManager:
             (assessment_uuid, output_layer, operation,
              source_target, source_assessment, feature_count)
         )
-        self.connection.commit()
+        self.commit()
         cursor.close()
 
     def get_results_for_assessment(self, assessment_uuid):
@@ -466,7 +572,7 @@ class ProjectManager:
         # Step 2: Copy all data to the new table name
         cursor = self.connection.cursor()
         cursor.execute(f"CREATE TABLE {new_name} AS SELECT * FROM {old_name}")
-        self.connection.commit()
+        self.commit()
         cursor.close()
 
         # Step 3: Remove the original table and ALL its SpatiaLite metadata
@@ -484,7 +590,7 @@ class ProjectManager:
                     f"{srid}, '{try_type}', '{dimension}')"
                 )
                 result = cursor.fetchone()
-                self.connection.commit()
+                self.commit()
                 if result and result[0] == 1:
                     registered = True
                     break
@@ -497,7 +603,7 @@ class ProjectManager:
         # Step 5: Recreate spatial index on the new table
         try:
             cursor.execute(f"SELECT CreateSpatialIndex('{new_name}', 'geom')")
-            self.connection.commit()
+            self.commit()
         except Exception as e:
             print(f"Note: Could not recreate spatial index for '{new_name}': {e}")
 
@@ -518,7 +624,7 @@ class ProjectManager:
         cursor.execute(
             f'ALTER TABLE {table_name} ADD COLUMN "{column_name}" {column_type}{default_clause}'
         )
-        self.connection.commit()
+        self.commit()
         cursor.close()
 
     def update_column_values(self, table_name, column_name, id_value_pairs):
@@ -535,7 +641,7 @@ class ProjectManager:
                 f'UPDATE {table_name} SET "{column_name}" = ? WHERE id = ?',
                 (value, row_id)
             )
-        self.connection.commit()
+        self.commit()
         cursor.close()
 
     def cleanup_temp_tables(self):
@@ -587,7 +693,7 @@ class ProjectManager:
                VALUES (?, ?, ?, ?, 1)""",
             (scenario_name, table_name, description, parent_version_id)
         )
-        self.connection.commit()
+        self.commit()
         version_id = cursor.lastrowid
         cursor.close()
         return version_id
@@ -658,7 +764,7 @@ class ProjectManager:
             "UPDATE spatial_versions SET is_current = 1 WHERE id = ?",
             (version_id,)
         )
-        self.connection.commit()
+        self.commit()
         cursor.close()
 
     def _row_to_version(self, r):
@@ -722,15 +828,10 @@ class ProjectManager:
     def sanitize_table_name(self, layer_name):
         """Convert layer name to valid SQLite table name.
         Preserves __ as separator between project and assessment names.
+        Results are memoized; the same names are sanitized repeatedly
+        during a single overlay run.
         """
-        table_name = re.sub(r'[^a-zA-Z0-9_]', '_', layer_name)
-        table_name = table_name.lower()
-        # Remove 3+ consecutive underscores (preserves __ as separator)
-        table_name = re.sub(r'_{3,}', '__', table_name)
-        table_name = table_name.strip('_')
-        if table_name and table_name[0].isdigit():
-            table_name = 'layer_' + table_name
-        return table_name if table_name else 'unnamed_layer'
+        return _sanitize_table_name(layer_name)
 
     def get_spatialite_type(self, layer):
         """Map QGIS layer geometry to SpatiaLite geometry type string."""
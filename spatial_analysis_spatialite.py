@@ -34,7 +34,8 @@ class SpatialAnalyzerLite:
 
     def analyze_and_create_layer(self, target_table, assessment_table, output_table,
                                  layer_name=None, operation_type=OperationType.BOTH,
-                                 group_name=None, add_to_qgis=True):
+                                 group_name=None, add_to_qgis=True,
+                                 count_features=True):
         """
         Perform spatial analysis between target and assessment layers.
 
@@ -47,6 +48,8 @@ class SpatialAnalyzerLite:
             group_name: Optional layer tree group name for the QGIS layer
             add_to_qgis: If False, only create the SpatiaLite table without adding
                          a layer to QGIS (used for intermediate/temporary tables)
+            count_features: If False, skip the COUNT(*) over the output table;
+                            total_count is then None
 
         Returns:
             dict: Results including total_count, output_table, layer, success
@@ -84,11 +87,12 @@ class SpatialAnalyzerLite:
 
         try:
             cursor.execute(query)
-            self.pm.connection.commit()
+            self.pm.commit()
 
-            # Get total count
-            cursor.execute(f"SELECT COUNT(*) FROM {output_table}")
-            total_count = cursor.fetchone()[0]
+            total_count = None
+            if count_features:
+                cursor.execute(f"SELECT COUNT(*) FROM {output_table}")
+                total_count = cursor.fetchone()[0]
 
             # Detect actual geometry type and dimension from output data
             geom_type, dimension = self._detect_geometry_info(output_table)
@@ -102,7 +106,7 @@ class SpatialAnalyzerLite:
                         f"{target_srid}, '{try_type}', '{dimension}')"
                     )
                     result = cursor.fetchone()
-                    self.pm.connection.commit()
+                    self.pm.commit()
                     if result and result[0] == 1:
                         registered = True
                         print(f"Geometry registered for {output_table}: type={try_type}, dim={dimension}, srid={target_srid}")
@@ -122,7 +126,7 @@ class SpatialAnalyzerLite:
                 cursor.execute(
                     f"SELECT CreateSpatialIndex('{output_table}', 'geom')"
                 )
-                self.pm.connection.commit()
+                self.pm.commit()
             except Exception as e:
                 print(f"Note: Could not create spatial index for {output_table}: {e}")
 
@@ -157,26 +161,44 @@ class SpatialAnalyzerLite:
         Returns:
             QgsVectorLayer: The created layer
         """
-        if not layer_name:
-            layer_name = table_name
+        return self._create_qgis_layers([(table_name, layer_name)], group_name)[0]
 
-        uri = f"dbname='{self.pm.db_path}' table='{table_name}' (geom)"
-        layer = QgsVectorLayer(uri, layer_name, "spatialite")
+    def _create_qgis_layers(self, tables, group_name=None):
+        """
+        Create QGIS vector layers for several SpatiaLite tables at once.
+
+        All layers are registered with a single addMapLayers() call, so the
+        project and layer tree react once instead of once per layer.
 
-        if not layer.isValid():
-            raise Exception(f"Failed to create QGIS layer from table '{table_name}'")
+        Args:
+            tables: list of (table_name, layer_name) tuples; a falsy
+                    layer_name defaults to table_name
+            group_name: Optional group name to place the layers in
 
+        Returns:
+            list[QgsVectorLayer]: The created layers, in input order
+        """
+        layers = []
+        for table_name, layer_name in tables:
+            uri = f"dbname='{self.pm.db_path}' table='{table_name}' (geom)"
+            layer = QgsVectorLayer(uri, layer_name or table_name, "spatialite")
+            if not layer.isValid():
+                raise Exception(f"Failed to create QGIS layer from table '{table_name}'")
+            layers.append(layer)
+
+        project = QgsProject.instance()
         if group_name:
-            root = QgsProject.instance().layerTreeRoot()
+            root = project.layerTreeRoot()
             group = root.findGroup(group_name)
             if not group:
                 group = root.addGroup(group_name)
-            QgsProject.instance().addMapLayer(layer, False)
-            group.addLayer(layer)
+            project.addMapLayers(layers, False)
+            for layer in layers:
+                group.addLayer(layer)
         else:
-            QgsProject.instance().addMapLayer(layer)
+            project.addMapLayers(layers)
 
-        return layer
+        return layers
 
     # ------------------------------------------------------------------ #
     #  Query builders (PostGIS → SpatiaLite equivalences)
@@ -0,0 +1,340 @@
+# coding=utf-8
+"""AdminManager tests (plain sqlite3, no QGIS or SpatiaLite needed).
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'davidt1987@gmail.com'
+__date__ = '2025-12-16'
+__copyright__ = 'Copyright 2025, David Torres'
+
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+import admin_manager
+from admin_manager import AdminManager
+
+
+class AdminManagerTestBase(unittest.TestCase):
+    """Fresh admin.sqlite in a temporary plugin dir for every test.
+
+    Project SpatiaLite init is patched out: it needs the SpatiaLite
+    extension and is not what these tests cover.
+    """
+
+    def setUp(self):
+        """Runs before each test."""
+        self.plugin_dir = tempfile.mkdtemp()
+        patcher = mock.patch.object(AdminManager, '_start_project_db_init')
+        self.start_db_init = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.am = AdminManager(self.plugin_dir)
+        self.am.connect()
+
+    def tearDown(self):
+        """Runs after each test."""
+        self.am.disconnect()
+        shutil.rmtree(self.plugin_dir, ignore_errors=True)
+
+    def count(self, table):
+        return self.am.connection.execute(
+            f"SELECT COUNT(*) FROM {table}"
+        ).fetchone()[0]
+
+
+class TransactionTest(AdminManagerTestBase):
+    """transaction(): nesting, commit and rollback."""
+
+    def test_nested_blocks_commit_once(self):
+        """Inner blocks join the outer one; nothing commits before it ends."""
+        with self.am.transaction():
+            pid = self.am.create_project("P")
+            with self.am.transaction():
+                self.am.create_assessment(pid, "A")
+            self.assertTrue(self.am.connection.in_transaction)
+        self.assertFalse(self.am.connection.in_transaction)
+        self.assertEqual(self.count('projects'), 1)
+        self.assertEqual(self.count('assessments'), 1)
+
+    def test_inner_error_rolls_back_outer_block(self):
+        """An error in a nested block undoes every write of the outer one."""
+        with self.assertRaises(RuntimeError):
+            with self.am.transaction():
+                pid = self.am.create_project("P")
+                with self.am.transaction():
+                    self.am.create_assessment(pid, "A")
+                    raise RuntimeError("boom")
+        self.assertFalse(self.am.connection.in_transaction)
+        self.assertEqual(self.count('projects'), 0)
+        self.assertEqual(self.count('assessments'), 0)
+
+    def test_rollback_clears_name_cache(self):
+        """A name added to the cache inside a rolled-back block is dropped."""
+        pid = self.am.create_project("P")
+        self.assertFalse(self.am.assessment_name_exists(pid, "A"))
+        with self.assertRaises(RuntimeError):
+            with self.am.transaction():
+                self.am.create_assessment(pid, "A")
+                self.assertTrue(self.am.assessment_name_exists(pid, "A"))
+                raise RuntimeError("boom")
+        self.assertFalse(self.am.assessment_name_exists(pid, "A"))
+
+    def test_failed_write_leaves_no_transaction_open(self):
+        """A constraint error inside a write method rolls back its block."""
+        pid = self.am.create_project("P")
+        self.am.create_assessment(pid, "A")
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.am.create_assessment(pid, "A")
+        self.assertFalse(self.am.connection.in_transaction)
+        self.assertEqual(self.count('assessments'), 1)
+
+
+class AssessmentNameTest(AdminManagerTestBase):
+    """Duplicate and soft-deleted assessment names."""
+
+    def setUp(self):
+        super().setUp()
+        self.pid = self.am.create_project("P")
+
+    def test_name_is_taken_once_created(self):
+        self.am.create_assessment(self.pid, "A")
+        self.assertTrue(self.am.assessment_name_exists(self.pid, "A"))
+        self.assertFalse(self.am.assessment_name_exists(self.pid, "B"))
+
+    def test_names_are_per_project(self):
+        other = self.am.create_project("Q")
+        self.am.create_assessment(self.pid, "A")
+        self.assertFalse(self.am.assessment_name_exists(other, "A"))
+        self.am.create_assessment(other, "A")
+        self.assertTrue(self.am.assessment_name_exists(other, "A"))
+
+    def test_cached_names_see_later_creates(self):
+        """The name set built by the first lookup is kept in step."""
+        self.assertFalse(self.am.assessment_name_exists(self.pid, "A"))
+        self.am.create_assessment(self.pid, "A")
+        self.assertTrue(self.am.assessment_name_exists(self.pid, "A"))
+
+    def test_soft_deleted_name_stays_taken(self):
+        """Soft-deleted rows still hold UNIQUE(project_id, name)."""
+        aid = self.am.create_assessment(self.pid, "A")
+        self.am.delete_assessment(aid)
+        self.assertEqual(self.am.get_assessments_for_project(self.pid), [])
+        self.assertTrue(self.am.assessment_name_exists(self.pid, "A"))
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.am.create_assessment(self.pid, "A")
+
+    def test_purged_name_is_free_again(self):
+        aid = self.am.create_assessment(self.pid, "A")
+        self.assertTrue(self.am.assessment_name_exists(self.pid, "A"))
+        self.am.purge_assessment(aid)
+        self.assertFalse(self.am.assessment_name_exists(self.pid, "A"))
+        self.am.create_assessment(self.pid, "A")
+
+
+class MigrateFromMetadataDbTest(AdminManagerTestBase):
+    """migrate_from_metadata_db() on both bulk-insert paths."""
+
+    def setUp(self):
+        super().setUp()
+        self.old_db = os.path.join(self.plugin_dir, "metadata.db")
+        conn = sqlite3.connect(self.old_db)
+        conn.executescript("""
+            CREATE TABLE projects (
+                id INTEGER PRIMARY KEY, name TEXT, description TEXT);
+            CREATE TABLE assessments (
+                id INTEGER PRIMARY KEY, project_id INTEGER, name TEXT,
+                description TEXT, target_layer TEXT,
+                assessment_layers TEXT, output_tables TEXT);
+        """)
+        conn.executemany(
+            "INSERT INTO projects VALUES (?, ?, ?)",
+            [(1, "Alpha", "first"), (2, "Beta", None), (3, "Alpha", "dup")]
+        )
+        conn.executemany(
+            "INSERT INTO assessments VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (1, 1, "A1", "d", "roads", '["soils", "water"]', '["out_a1"]'),
+                (2, 1, "A2", None, None, None, ' ["out_a2"]'),
+                (3, 2, "B1", "", "parcels", "not json", ""),
+                (4, 3, "A1", "same name, same project", "", "[]", "[]"),
+                (5, 9, "Orphan", "", "", "[]", "[]"),
+            ]
+        )
+        conn.commit()
+        conn.close()
+
+    def check_migration(self):
+        stats = self.am.migrate_from_metadata_db(self.old_db)
+        self.assertEqual(stats, {'projects_migrated': 2,
+                                 'assessments_migrated': 3})
+
+        projects = {p['name']: p for p in self.am.get_all_projects()}
+        self.assertEqual(sorted(projects), ["Alpha", "Beta"])
+        self.assertEqual(projects["Alpha"]['description'], "first")
+        self.assertEqual(self.start_db_init.call_count, 2)
+
+        alpha = {a['name']: a for a in
+                 self.am.get_assessments_for_project(projects["Alpha"]['id'])}
+        self.assertEqual(sorted(alpha), ["A1", "A2"])
+        self.assertEqual(alpha["A1"]['target_layer'], "roads")
+        self.assertEqual(alpha["A1"]['output_tables'], ["out_a1"])
+        self.assertEqual(alpha["A2"]['output_tables'], ["out_a2"])
+        inputs = self.am.get_assessment_layers(alpha["A1"]['id'],
+                                               layer_type='input')
+        self.assertEqual([l['layer_name'] for l in inputs],
+                         ["soils", "water"])
+
+        beta = self.am.get_assessments_for_project(projects["Beta"]['id'])
+        self.assertEqual([a['name'] for a in beta], ["B1"])
+        self.assertEqual(beta[0]['output_tables'], [])
+
+        # Every migrated name is visible to the duplicate check
+        self.assertTrue(
+            self.am.assessment_name_exists(projects["Alpha"]['id'], "A2"))
+
+        # A second run finds everything in place
+        stats = self.am.migrate_from_metadata_db(self.old_db)
+        self.assertEqual(stats, {'projects_migrated': 0,
+                                 'assessments_migrated': 0})
+        self.assertEqual(self.count('assessments'), 3)
+
+    @unittest.skipUnless(admin_manager._HAS_RETURNING,
+                         "SQLite < 3.35 has no RETURNING")
+    def test_returning_path(self):
+        self.check_migration()
+
+    def test_fallback_path(self):
+        with mock.patch.object(admin_manager, '_HAS_RETURNING', False):
+            self.check_migration()
+
+    def test_missing_file(self):
+        stats = self.am.migrate_from_metadata_db(
+            os.path.join(self.plugin_dir, "nope.db"))
+        self.assertEqual(stats, {'projects_migrated': 0,
+                                 'assessments_migrated': 0})
+
+
+class TaskTreeTest(AdminManagerTestBase):
+    """build_task_tree(): nesting and sibling order."""
+
+    def setUp(self):
+        super().setUp()
+        pid = self.am.create_project("P")
+        aid = self.am.create_assessment(pid, "A")
+        self.prov = self.am.create_provenance(aid, "run")
+
+    def shape(self, tasks):
+        return [(t['operation'], self.shape(t['children'])) for t in tasks]
+
+    def test_siblings_sort_numerically(self):
+        """Negative and wide step_order values sort as numbers."""
+        self.am.add_task(self.prov, 10, "ten")
+        self.am.add_task(self.prov, -1, "minus_one")
+        self.am.add_task(self.prov, 2, "two")
+        self.am.add_task(self.prov, 1234567890, "wide")
+        self.am.add_task(self.prov, -20, "minus_twenty")
+        self.assertEqual(
+            [op for op, _ in self.shape(self.am.build_task_tree(self.prov))],
+            ["minus_twenty", "minus_one", "two", "ten", "wide"]
+        )
+
+    def test_ties_sort_by_id(self):
+        first = self.am.add_task(self.prov, 1, "first")
+        second = self.am.add_task(self.prov, 1, "second")
+        self.assertLess(first, second)
+        self.assertEqual(
+            [op for op, _ in self.shape(self.am.build_task_tree(self.prov))],
+            ["first", "second"]
+        )
+
+    def test_children_nest_under_parents(self):
+        root_b = self.am.add_task(self.prov, 2, "b")
+        root_a = self.am.add_task(self.prov, 1, "a")
+        self.am.add_task(self.prov, 5, "b2", parent_task_id=root_b)
+        b1 = self.am.add_task(self.prov, -5, "b1", parent_task_id=root_b)
+        self.am.add_task(self.prov, 1, "b1x", parent_task_id=b1)
+        self.am.add_task(self.prov, 1, "a1", parent_task_id=root_a)
+        self.assertEqual(
+            self.shape(self.am.build_task_tree(self.prov)),
+            [("a", [("a1", [])]),
+             ("b", [("b1", [("b1x", [])]), ("b2", [])])]
+        )
+
+    def test_other_provenance_is_excluded(self):
+        other = self.am.create_provenance(
+            self.am.create_assessment(self.am.create_project("Q"), "B"), "x")
+        self.am.add_task(self.prov, 1, "mine")
+        self.am.add_task(other, 1, "theirs")
+        self.assertEqual(self.shape(self.am.build_task_tree(self.prov)),
+                         [("mine", [])])
+
+
+class SchemaVersionTest(AdminManagerTestBase):
+    """_migrate_schema(): the schema_version gate."""
+
+    def schema_version(self):
+        return self.am.connection.execute(
+            "SELECT schema_version FROM app_settings WHERE id = 1"
+        ).fetchone()[0]
+
+    def test_new_database_is_current(self):
+        self.assertEqual(self.schema_version(), AdminManager.SCHEMA_VERSION)
+
+    def test_current_database_skips_migration(self):
+        """At SCHEMA_VERSION the gate is one SELECT: no DDL, no write."""
+        statements = []
+        self.am.connection.set_trace_callback(statements.append)
+        try:
+            self.am._migrate_schema()
+        finally:
+            self.am.connection.set_trace_callback(None)
+        self.assertEqual(len(statements), 1)
+        self.assertTrue(statements[0].lstrip().upper().startswith("SELECT"))
+
+    def test_old_database_is_migrated(self):
+        """A pre-versioning database gets the missing columns and the version."""
+        self.am.disconnect()
+        db_path = os.path.join(self.plugin_dir, "admin.sqlite")
+        os.remove(db_path)
+        conn = sqlite3.connect(db_path)
+        conn.executescript("""
+            CREATE TABLE projects (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                uuid TEXT UNIQUE NOT NULL, name TEXT UNIQUE NOT NULL,
+                description TEXT DEFAULT '', db_path TEXT NOT NULL,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP);
+            CREATE TABLE app_settings (id INTEGER PRIMARY KEY);
+            INSERT INTO projects (uuid, name, db_path)
+                VALUES ('u1', 'Legacy', 'projects/legacy.sqlite');
+            INSERT INTO app_settings (id) VALUES (1);
+        """)
+        conn.close()
+
+        self.am = AdminManager(self.plugin_dir)
+        self.am.connect()
+        self.assertEqual(self.schema_version(), AdminManager.SCHEMA_VERSION)
+        columns = {r[0] for r in self.am.connection.execute(
+            "SELECT name FROM pragma_table_info('projects')")}
+        self.assertTrue({'is_deleted', 'base_layer_names'} <= columns)
+        self.assertEqual([p['name'] for p in self.am.get_all_projects()],
+                         ["Legacy"])
+
+    def test_rerun_after_reset_is_idempotent(self):
+        """Columns already present are not added twice."""
+        self.am.connection.execute(
+            "UPDATE app_settings SET schema_version = 0 WHERE id = 1")
+        self.am._migrate_schema()
+        self.assertEqual(self.schema_version(), AdminManager.SCHEMA_VERSION)
+
+
+if __name__ == "__main__":
+    unittest.main()